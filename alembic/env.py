@@ -21,6 +21,11 @@ config = context.config
 # This avoids importing settings and triggering validation during Docker build
 database_url = os.getenv("DATABASE_URL")
 if database_url:
+    # Use the psycopg 3 driver for plain postgres URLs (same as the application)
+    for scheme in ("postgresql://", "postgres://"):
+        if database_url.startswith(scheme):
+            database_url = "postgresql+psycopg://" + database_url[len(scheme) :]
+            break
     config.set_main_option("sqlalchemy.url", database_url)
 else:
     # Fallback: construct from individual env vars
@@ -31,7 +36,7 @@ else:
     db_password = os.getenv("DB_PASSWORD")
 
     if db_name and db_user and db_password:
-        url = f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+        url = f"postgresql+psycopg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
         config.set_main_option("sqlalchemy.url", url)
 
 # Interpret the config file for Python logging.
@@ -0,0 +1,67 @@
+"""brin_indexes_on_created_at
+
+Revision ID: b3f1c9d2e4a7
+Revises: 6aeaf4a488e7
+Create Date: 2026-10-16 03:30:12.418207+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f1c9d2e4a7'
+down_revision: Union[str, Sequence[str], None] = '6aeaf4a488e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace B-tree indexes on created_at with BRIN; add per-user timeline index on audit_log."""
+    # emotions.created_at only grows, so a BRIN index summarises it in a few pages
+    # instead of a B-tree entry per row. Per-user timelines are served by
+    # ix_emotions_user_created (user_id, created_at DESC), created in 001.
+    op.drop_index('ix_emotions_created_at', table_name='emotions', if_exists=True)
+    op.drop_index('idx_emotions_created_desc', table_name='emotions', if_exists=True)
+    op.create_index(
+        'ix_emotions_created_brin',
+        'emotions',
+        ['created_at'],
+        postgresql_using='brin',
+        if_not_exists=True
+    )
+
+    # Same for the append-only audit log
+    op.drop_index('ix_audit_log_created_at', table_name='audit_log', if_exists=True)
+    op.create_index(
+        'ix_audit_log_created_brin',
+        'audit_log',
+        ['created_at'],
+        postgresql_using='brin',
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_audit_log_user_created',
+        'audit_log',
+        ['user_id', sa.text('created_at DESC')],
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    """Restore B-tree indexes on created_at."""
+    op.drop_index('ix_audit_log_user_created', table_name='audit_log', if_exists=True)
+    op.drop_index('ix_audit_log_created_brin', table_name='audit_log', if_exists=True)
+    op.create_index('ix_audit_log_created_at', 'audit_log', ['created_at'], if_not_exists=True)
+
+    op.drop_index('ix_emotions_created_brin', table_name='emotions', if_exists=True)
+    op.create_index(
+        'idx_emotions_created_desc',
+        'emotions',
+        [sa.desc('created_at')],
+        postgresql_using='btree',
+        if_not_exists=True
+    )
+    op.create_index('ix_emotions_created_at', 'emotions', ['created_at'], if_not_exists=True)
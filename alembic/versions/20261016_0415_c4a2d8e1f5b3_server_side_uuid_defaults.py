@@ -0,0 +1,31 @@
+"""server_side_uuid_defaults
+
+Revision ID: c4a2d8e1f5b3
+Revises: b3f1c9d2e4a7
+Create Date: 2026-10-16 04:15:47.902316+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a2d8e1f5b3'
+down_revision: Union[str, Sequence[str], None] = 'b3f1c9d2e4a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Generate emotions.id and audit_log.id in the database."""
+    # gen_random_uuid() is built in since PostgreSQL 13, no pgcrypto needed
+    op.alter_column('emotions', 'id', server_default=sa.text('gen_random_uuid()'))
+    op.alter_column('audit_log', 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    """Drop server-side UUID defaults."""
+    op.alter_column('audit_log', 'id', server_default=None)
+    op.alter_column('emotions', 'id', server_default=None)
@@ -0,0 +1,97 @@
+"""partition_emotions_by_month
+
+Revision ID: d5b3e9f2a6c4
+Revises: c4a2d8e1f5b3
+Create Date: 2026-10-16 05:00:21.337804+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5b3e9f2a6c4'
+down_revision: Union[str, Sequence[str], None] = 'c4a2d8e1f5b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_emotion_indexes() -> None:
+    """Recreate the emotions indexes (on the partitioned parent they cascade to partitions)."""
+    op.create_index('ix_emotions_user_id', 'emotions', ['user_id'])
+    op.create_index('ix_emotions_emotion', 'emotions', ['emotion'])
+    op.create_index('ix_emotions_model_type', 'emotions', ['model_type'])
+    op.create_index('ix_emotions_user_created', 'emotions', ['user_id', sa.text('created_at DESC')])
+    op.create_index('idx_emotions_user_created', 'emotions', ['user_id', 'created_at'])
+    op.create_index('idx_emotions_type_created', 'emotions', ['emotion', 'created_at'])
+    op.create_index('ix_emotions_created_brin', 'emotions', ['created_at'], postgresql_using='brin')
+
+
+def upgrade() -> None:
+    """Rebuild emotions as a table range-partitioned by month on created_at."""
+    # The partition key must be part of the primary key: PK becomes (id, created_at)
+    op.execute("""
+        CREATE TABLE emotions_partitioned (
+            LIKE emotions INCLUDING DEFAULTS INCLUDING COMMENTS
+        ) PARTITION BY RANGE (created_at);
+    """)
+    op.execute("""
+        ALTER TABLE emotions_partitioned
+            ADD CONSTRAINT emotions_partitioned_pkey PRIMARY KEY (id, created_at),
+            ADD CONSTRAINT emotions_partitioned_user_id_fkey
+                FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE;
+    """)
+
+    # Monthly partitions covering existing rows through two months ahead,
+    # plus a DEFAULT partition so inserts never fail on a missing month
+    op.execute("""
+        DO $$
+        DECLARE
+            month_start timestamptz;
+        BEGIN
+            FOR month_start IN
+                SELECT generate_series(
+                    date_trunc('month', COALESCE(MIN(created_at), now()) AT TIME ZONE 'UTC'),
+                    date_trunc('month', now() AT TIME ZONE 'UTC') + interval '2 months',
+                    interval '1 month'
+                ) AT TIME ZONE 'UTC'
+                FROM emotions
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE emotions_%s PARTITION OF emotions_partitioned '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    to_char(month_start AT TIME ZONE 'UTC', 'YYYY_MM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+            END LOOP;
+        END $$;
+    """)
+    op.execute("CREATE TABLE emotions_default PARTITION OF emotions_partitioned DEFAULT;")
+
+    op.execute("INSERT INTO emotions_partitioned SELECT * FROM emotions;")
+    op.drop_table('emotions')
+
+    op.rename_table('emotions_partitioned', 'emotions')
+    op.execute("ALTER TABLE emotions RENAME CONSTRAINT emotions_partitioned_pkey TO emotions_pkey;")
+    op.execute(
+        "ALTER TABLE emotions RENAME CONSTRAINT emotions_partitioned_user_id_fkey "
+        "TO emotions_user_id_fkey;"
+    )
+    _create_emotion_indexes()
+
+
+def downgrade() -> None:
+    """Rebuild emotions as a plain table (partitions are dropped after copying rows)."""
+    op.execute("CREATE TABLE emotions_plain (LIKE emotions INCLUDING DEFAULTS INCLUDING COMMENTS);")
+    op.execute("INSERT INTO emotions_plain SELECT * FROM emotions;")
+    op.drop_table('emotions')  # Drops all partitions with it
+
+    op.rename_table('emotions_plain', 'emotions')
+    op.create_primary_key('emotions_pkey', 'emotions', ['id'])
+    op.create_foreign_key(
+        'emotions_user_id_fkey', 'emotions', 'users', ['user_id'], ['id'], ondelete='CASCADE'
+    )
+    _create_emotion_indexes()
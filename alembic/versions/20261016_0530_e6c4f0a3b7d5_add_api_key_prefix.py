@@ -0,0 +1,39 @@
+"""add_api_key_prefix
+
+Revision ID: e6c4f0a3b7d5
+Revises: d5b3e9f2a6c4
+Create Date: 2026-10-16 05:30:09.614520+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6c4f0a3b7d5'
+down_revision: Union[str, Sequence[str], None] = 'd5b3e9f2a6c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add indexed key_prefix lookup column to api_keys."""
+    # Existing keys stay NULL (plaintext is unknown); they are backfilled on first use
+    op.add_column(
+        'api_keys',
+        sa.Column(
+            'key_prefix',
+            sa.String(length=16),
+            nullable=True,
+            comment='SHA-256 prefix of API key for lookup'
+        )
+    )
+    op.create_index('ix_api_keys_key_prefix', 'api_keys', ['key_prefix'], unique=False)
+
+
+def downgrade() -> None:
+    """Remove key_prefix column."""
+    op.drop_index('ix_api_keys_key_prefix', table_name='api_keys')
+    op.drop_column('api_keys', 'key_prefix')
@@ -0,0 +1,38 @@
+"""partial_index_active_api_keys
+
+Revision ID: f7d5a1b4c8e6
+Revises: e6c4f0a3b7d5
+Create Date: 2026-10-16 06:00:41.208733+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7d5a1b4c8e6'
+down_revision: Union[str, Sequence[str], None] = 'e6c4f0a3b7d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the key_prefix index with a partial index over active keys."""
+    # now() is not immutable, so expiry cannot be part of the predicate;
+    # validate_key filters expires_at on the (tiny) matching set instead
+    op.drop_index('ix_api_keys_key_prefix', table_name='api_keys')
+    op.create_index(
+        'ix_api_keys_active_key_prefix',
+        'api_keys',
+        ['key_prefix'],
+        unique=False,
+        postgresql_where=sa.text('is_active')
+    )
+
+
+def downgrade() -> None:
+    """Restore the full key_prefix index."""
+    op.drop_index('ix_api_keys_active_key_prefix', table_name='api_keys')
+    op.create_index('ix_api_keys_key_prefix', 'api_keys', ['key_prefix'], unique=False)
@@ -0,0 +1,56 @@
+"""uuidv7_audit_log_ids
+
+Revision ID: a8e6b2c5d9f7
+Revises: f7d5a1b4c8e6
+Create Date: 2026-10-16 06:30:12.553904+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e6b2c5d9f7'
+down_revision: Union[str, Sequence[str], None] = 'f7d5a1b4c8e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same definition as infrastructure.database.models.UUID_V7_FUNCTION (kept inline:
+# migrations must not change when application code does)
+UUID_V7_FUNCTION = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(
+                        int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                        FROM 3
+                    )
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid
+$$ LANGUAGE sql VOLATILE
+"""
+
+
+def upgrade() -> None:
+    """Default audit_log.id to time-ordered UUIDv7."""
+    # Plain SQL function: no pg_uuidv7 extension (not available on every host)
+    op.execute(UUID_V7_FUNCTION)
+    op.alter_column('audit_log', 'id', server_default=sa.text('uuid_generate_v7()'))
+
+
+def downgrade() -> None:
+    """Restore random UUIDv4 default."""
+    op.alter_column('audit_log', 'id', server_default=sa.text('gen_random_uuid()'))
+    op.execute('DROP FUNCTION IF EXISTS uuid_generate_v7()')
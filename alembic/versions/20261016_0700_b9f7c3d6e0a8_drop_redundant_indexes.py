@@ -0,0 +1,41 @@
+"""drop_redundant_indexes
+
+Revision ID: b9f7c3d6e0a8
+Revises: a8e6b2c5d9f7
+Create Date: 2026-10-16 07:00:26.318047+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9f7c3d6e0a8'
+down_revision: Union[str, Sequence[str], None] = 'a8e6b2c5d9f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop indexes that duplicate a unique constraint or another index's prefix."""
+    # Same column as the UNIQUE constraint's own index
+    op.drop_index('ix_users_telegram_id_hash', table_name='users', if_exists=True)
+    op.drop_index('ix_api_keys_key_hash', table_name='api_keys', if_exists=True)
+
+    # Leading column of ix_emotions_user_created / ix_audit_log_user_created
+    op.drop_index('ix_emotions_user_id', table_name='emotions', if_exists=True)
+    op.drop_index('ix_audit_log_user_id', table_name='audit_log', if_exists=True)
+
+    # Same columns as ix_emotions_user_created (direction doesn't matter for scans)
+    op.drop_index('idx_emotions_user_created', table_name='emotions', if_exists=True)
+
+
+def downgrade() -> None:
+    """Recreate the dropped indexes."""
+    op.create_index('idx_emotions_user_created', 'emotions', ['user_id', 'created_at'])
+    op.create_index('ix_audit_log_user_id', 'audit_log', ['user_id'], unique=False)
+    op.create_index('ix_emotions_user_id', 'emotions', ['user_id'], unique=False)
+    op.create_index('ix_api_keys_key_hash', 'api_keys', ['key_hash'], unique=False)
+    op.create_index('ix_users_telegram_id_hash', 'users', ['telegram_id_hash'], unique=False)
@@ -0,0 +1,93 @@
+"""partition_audit_log_by_month
+
+Revision ID: c0a8d4e7f1b9
+Revises: b9f7c3d6e0a8
+Create Date: 2026-10-16 07:30:51.740962+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0a8d4e7f1b9'
+down_revision: Union[str, Sequence[str], None] = 'b9f7c3d6e0a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_audit_log_indexes() -> None:
+    """Recreate the audit_log indexes (on the partitioned parent they cascade to partitions)."""
+    op.create_index('ix_audit_log_action', 'audit_log', ['action'])
+    op.create_index('ix_audit_log_user_created', 'audit_log', ['user_id', sa.text('created_at DESC')])
+    op.create_index('ix_audit_log_created_brin', 'audit_log', ['created_at'], postgresql_using='brin')
+
+
+def upgrade() -> None:
+    """Rebuild audit_log as a table range-partitioned by month on created_at."""
+    # The partition key must be part of the primary key: PK becomes (id, created_at)
+    op.execute("""
+        CREATE TABLE audit_log_partitioned (
+            LIKE audit_log INCLUDING DEFAULTS INCLUDING COMMENTS
+        ) PARTITION BY RANGE (created_at);
+    """)
+    op.execute("""
+        ALTER TABLE audit_log_partitioned
+            ADD CONSTRAINT audit_log_partitioned_pkey PRIMARY KEY (id, created_at),
+            ADD CONSTRAINT audit_log_partitioned_user_id_fkey
+                FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE SET NULL;
+    """)
+
+    # Monthly partitions covering existing rows through two months ahead,
+    # plus a DEFAULT partition so inserts never fail on a missing month
+    op.execute("""
+        DO $$
+        DECLARE
+            month_start timestamptz;
+        BEGIN
+            FOR month_start IN
+                SELECT generate_series(
+                    date_trunc('month', COALESCE(MIN(created_at), now()) AT TIME ZONE 'UTC'),
+                    date_trunc('month', now() AT TIME ZONE 'UTC') + interval '2 months',
+                    interval '1 month'
+                ) AT TIME ZONE 'UTC'
+                FROM audit_log
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE audit_log_%s PARTITION OF audit_log_partitioned '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    to_char(month_start AT TIME ZONE 'UTC', 'YYYY_MM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+            END LOOP;
+        END $$;
+    """)
+    op.execute("CREATE TABLE audit_log_default PARTITION OF audit_log_partitioned DEFAULT;")
+
+    op.execute("INSERT INTO audit_log_partitioned SELECT * FROM audit_log;")
+    op.drop_table('audit_log')
+
+    op.rename_table('audit_log_partitioned', 'audit_log')
+    op.execute("ALTER TABLE audit_log RENAME CONSTRAINT audit_log_partitioned_pkey TO audit_log_pkey;")
+    op.execute(
+        "ALTER TABLE audit_log RENAME CONSTRAINT audit_log_partitioned_user_id_fkey "
+        "TO audit_log_user_id_fkey;"
+    )
+    _create_audit_log_indexes()
+
+
+def downgrade() -> None:
+    """Rebuild audit_log as a plain table (partitions are dropped after copying rows)."""
+    op.execute("CREATE TABLE audit_log_plain (LIKE audit_log INCLUDING DEFAULTS INCLUDING COMMENTS);")
+    op.execute("INSERT INTO audit_log_plain SELECT * FROM audit_log;")
+    op.drop_table('audit_log')  # Drops all partitions with it
+
+    op.rename_table('audit_log_plain', 'audit_log')
+    op.create_primary_key('audit_log_pkey', 'audit_log', ['id'])
+    op.create_foreign_key(
+        'audit_log_user_id_fkey', 'audit_log', 'users', ['user_id'], ['id'], ondelete='SET NULL'
+    )
+    _create_audit_log_indexes()
@@ -0,0 +1,40 @@
+"""audit_log_brin_pages_per_range
+
+Revision ID: d1b9e5f8a2c0
+Revises: c0a8d4e7f1b9
+Create Date: 2026-10-16 08:00:03.467120+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1b9e5f8a2c0'
+down_revision: Union[str, Sequence[str], None] = 'c0a8d4e7f1b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Rebuild the audit_log BRIN index with 32-page block ranges."""
+    # Default is 128 pages per summary; smaller ranges skip more of each
+    # monthly partition for short time windows, index stays a few pages
+    op.drop_index('ix_audit_log_created_brin', table_name='audit_log', if_exists=True)
+    op.create_index(
+        'ix_audit_log_created_brin',
+        'audit_log',
+        ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+
+
+def downgrade() -> None:
+    """Restore the BRIN index with default block ranges."""
+    op.drop_index('ix_audit_log_created_brin', table_name='audit_log', if_exists=True)
+    op.create_index(
+        'ix_audit_log_created_brin', 'audit_log', ['created_at'], postgresql_using='brin'
+    )
@@ -0,0 +1,37 @@
+"""covering_emotions_user_created
+
+Revision ID: e2c0f6a9b3d1
+Revises: d1b9e5f8a2c0
+Create Date: 2026-10-16 08:30:38.105829+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c0f6a9b3d1'
+down_revision: Union[str, Sequence[str], None] = 'd1b9e5f8a2c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Rebuild ix_emotions_user_created as a covering index."""
+    # Report queries read only these columns: index-only scans skip the heap
+    # (as long as autovacuum keeps the visibility map current)
+    op.drop_index('ix_emotions_user_created', table_name='emotions', if_exists=True)
+    op.create_index(
+        'ix_emotions_user_created',
+        'emotions',
+        ['user_id', sa.text('created_at DESC')],
+        postgresql_include=['id', 'emotion', 'sentiment', 'score', 'model_type']
+    )
+
+
+def downgrade() -> None:
+    """Restore the plain (user_id, created_at DESC) index."""
+    op.drop_index('ix_emotions_user_created', table_name='emotions', if_exists=True)
+    op.create_index('ix_emotions_user_created', 'emotions', ['user_id', sa.text('created_at DESC')])
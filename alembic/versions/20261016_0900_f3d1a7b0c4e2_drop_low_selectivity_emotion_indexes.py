@@ -0,0 +1,32 @@
+"""drop_low_selectivity_emotion_indexes
+
+Revision ID: f3d1a7b0c4e2
+Revises: e2c0f6a9b3d1
+Create Date: 2026-10-16 09:00:17.942368+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3d1a7b0c4e2'
+down_revision: Union[str, Sequence[str], None] = 'e2c0f6a9b3d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop single-column indexes on ~10-value columns."""
+    # No query filters on these alone; emotion filters are still served by
+    # idx_emotions_type_created (emotion, created_at)
+    op.drop_index('ix_emotions_emotion', table_name='emotions', if_exists=True)
+    op.drop_index('ix_emotions_model_type', table_name='emotions', if_exists=True)
+
+
+def downgrade() -> None:
+    """Recreate the single-column indexes."""
+    op.create_index('ix_emotions_model_type', 'emotions', ['model_type'], unique=False)
+    op.create_index('ix_emotions_emotion', 'emotions', ['emotion'], unique=False)
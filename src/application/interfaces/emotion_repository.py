@@ -1,6 +1,7 @@
 """Emotion repository interface (dependency inversion)."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from datetime import datetime
 from uuid import UUID
 
@@ -39,3 +40,24 @@ class IEmotionRepository(ABC):
     ) -> list[EmotionRecord]:
         """Find emotions for user within date range."""
         pass
+
+    @abstractmethod
+    def iter_by_user_and_period(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Iterator[EmotionRecord]:
+        """Stream emotions for user within date range."""
+        pass
+
+    @abstractmethod
+    def find_report_rows(
+        self,
+        telegram_hash: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[UUID, str, str | None, float, str, datetime]]:
+        """Find (id, emotion, sentiment, score, model_type, created_at) rows for a user."""
+        pass
@@ -1,11 +1,10 @@
 """Emotion analysis service (business logic layer)."""
 
-import asyncio
 import hashlib
 from datetime import datetime
 
 from config import get_logger
-from domain import EmotionRecord
+from domain import EmotionRecord, EmotionScore, UserId
 from infrastructure.cache import RedisCache
 from infrastructure.ml import ModelFactory
 
@@ -29,6 +28,30 @@ CACHE_TTL_EMOTION = 86400  # 24 hours - same text analysis cached for 1 day
 CACHE_TTL_MONTHLY = 3600  # 1 hour - stats can be cached longer
 
 
+def _month_range(month: str) -> tuple[datetime, datetime]:
+    """
+    Convert a YYYY-MM string into a half-open [start, end) datetime range.
+
+    Filtering created_at against bound values keeps the predicate sargable
+    for the (user_id, created_at) index.
+
+    Args:
+        month: Month in YYYY-MM format
+
+    Returns:
+        Tuple of (first instant of month, first instant of next month)
+
+    Raises:
+        ValueError: If month is not a valid YYYY-MM string
+    """
+    year, mon = map(int, month.split("-"))
+    if not (1 <= mon <= 12):
+        raise ValueError("Month must be between 01 and 12")
+    start_date = datetime(year, mon, 1)
+    end_date = datetime(year + 1, 1, 1) if mon == 12 else datetime(year, mon + 1, 1)
+    return start_date, end_date
+
+
 class EmotionService:
     """
     Service for emotion analysis operations.
@@ -83,10 +106,8 @@ class EmotionService:
         # Get Groq analyzer (handles all languages)
         analyzer = self.model_factory.get_groq_analyzer()
 
-        # Perform analysis (async API calls in parallel for speed)
-        (emotion, emotion_score), (sentiment, sentiment_score) = await asyncio.gather(
-            analyzer.analyze_emotion(text), analyzer.analyze_sentiment(text)
-        )
+        # Emotion + sentiment in a single API call
+        (emotion, emotion_score), (sentiment, sentiment_score) = await analyzer.analyze(text)
 
         logger.info(
             "Emotion analyzed",
@@ -141,50 +162,48 @@ class EmotionService:
         Returns:
             EmotionReportResponse DTO
         """
-        # Find user
-        user = self.user_repo.find_or_create_by_telegram_id(telegram_id)
+        # Reports are read-only: derive the user hash locally and let the
+        # repository join users, instead of a separate find-or-create round-trip
+        user_id = UserId.from_telegram(telegram_id)
 
         # Parse month filter if provided
+        start_date: datetime | None = None
+        end_date: datetime | None = None
+        limit: int | None = 1000  # Without a period, limit to last 1000
+        period_label = None
         if month:
             try:
-                # Parse YYYY-MM
-                year, mon = map(int, month.split("-"))
-                start_date = datetime(year, mon, 1)
-
-                # Calculate end of month
-                if mon == 12:
-                    end_date = datetime(year + 1, 1, 1)
-                else:
-                    end_date = datetime(year, mon + 1, 1)
-
-                emotions = self.emotion_repo.find_by_user_and_period(user.id, start_date, end_date)
+                start_date, end_date = _month_range(month)
+                limit = None
                 period_label = month
             except ValueError:
                 logger.warning("Invalid month format", month=month)
                 # Fall back to all emotions
-                emotions = self.emotion_repo.find_by_user(user.id, limit=1000)
-                period_label = None
-        else:
-            # Get all emotions (limited to last 1000)
-            emotions = self.emotion_repo.find_by_user(user.id, limit=1000)
-            period_label = None
-
-        # Convert to DTOs
-        emotion_dtos = [
-            EmotionRecordDTO(
-                id=str(e.id),
-                emotion=e.emotion.value,
-                sentiment=e.sentiment.value if e.sentiment else None,
-                score=e.score.to_float(),
-                confidence=str(e.score),
-                model_type=e.model_type.value,
-                created_at=e.created_at,
+                start_date = end_date = None
+
+        rows = self.emotion_repo.find_report_rows(
+            user_id.hashed_id, start_date=start_date, end_date=end_date, limit=limit
+        )
+
+        # Build DTOs straight from the projected columns (no domain entities,
+        # no decryption of text that the report never shows)
+        emotion_dtos: list[EmotionRecordDTO] = []
+        for record_id, emotion, sentiment, score, model_type, created_at in rows:
+            emotion_score = EmotionScore.from_float(score)
+            emotion_dtos.append(
+                EmotionRecordDTO(
+                    id=str(record_id),
+                    emotion=emotion,
+                    sentiment=sentiment,
+                    score=emotion_score.to_float(),
+                    confidence=str(emotion_score),
+                    model_type=model_type,
+                    created_at=created_at,
+                )
             )
-            for e in emotions
-        ]
 
         return EmotionReportResponse(
-            user_id=user.user_id.hashed_id[:16],  # Partial hash for privacy
+            user_id=user_id.hashed_id[:16],  # Partial hash for privacy
             period=period_label,
             total_records=len(emotion_dtos),
             emotions=emotion_dtos,
@@ -210,20 +229,11 @@ class EmotionService:
         """
         # Validate month format
         try:
-            year, mon = map(int, month.split("-"))
-            if not (1 <= mon <= 12):
-                raise ValueError("Month must be between 01 and 12")
-            start_date = datetime(year, mon, 1)
+            start_date, end_date = _month_range(month)
         except (ValueError, AttributeError) as e:
             logger.error("Invalid month format", month=month, error=str(e))
             raise ValueError("Invalid month format. Use YYYY-MM (e.g., 2026-01)") from e
 
-        # Calculate end of month
-        if mon == 12:
-            end_date = datetime(year + 1, 1, 1)
-        else:
-            end_date = datetime(year, mon + 1, 1)
-
         # Find user
         user = self.user_repo.find_or_create_by_telegram_id(telegram_id)
 
@@ -236,33 +246,35 @@ class EmotionService:
 
         total = len(emotions)
 
-        # Calculate active days (unique dates)
-        active_days = len({e.created_at.date() for e in emotions})
-
-        # Count emotions and scores
-        emotion_counts: dict[str, list[float]] = {}  # emotion -> list of scores
+        # Single pass: per-emotion count and score sum, sentiment counts, active days
+        emotion_counts: dict[str, int] = {}
+        emotion_score_sums: dict[str, float] = {}
         sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
+        active_dates = set()
 
-        for e in emotions:
-            # Emotion aggregation
-            if e.emotion.value not in emotion_counts:
-                emotion_counts[e.emotion.value] = []
-            emotion_counts[e.emotion.value].append(e.score.to_float())
+        for record in emotions:
+            name = record.emotion.value
+            emotion_counts[name] = emotion_counts.get(name, 0) + 1
+            emotion_score_sums[name] = emotion_score_sums.get(name, 0.0) + record.score.to_float()
 
-            # Sentiment aggregation
-            if e.sentiment:
-                sentiment_counts[e.sentiment.value] += 1
+            if record.sentiment:
+                sentiment_counts[record.sentiment.value] += 1
 
-        # Build emotion statistics
-        emotion_stats: dict[str, EmotionStatistic] = {}
-        for emotion, scores in emotion_counts.items():
-            count = len(scores)
-            percentage = round(count / total * 100, 1)
-            avg_score = round(sum(scores) / count, 2)
+            active_dates.add(record.created_at.date())
+
+        active_days = len(active_dates)
 
+        # Build emotion statistics, tracking the dominant (most frequent) emotion
+        emotion_stats: dict[str, EmotionStatistic] = {}
+        dominant_emotion, dominant_count = "", 0
+        for emotion, count in emotion_counts.items():
             emotion_stats[emotion] = EmotionStatistic(
-                count=count, percentage=percentage, avg_score=avg_score
+                count=count,
+                percentage=round(count / total * 100, 1),
+                avg_score=round(emotion_score_sums[emotion] / count, 2),
             )
+            if count > dominant_count:
+                dominant_emotion, dominant_count = emotion, count
 
         # Build sentiment statistics
         sentiment_total = sum(sentiment_counts.values())
@@ -283,9 +295,6 @@ class EmotionService:
         )
         sentiment_stats = SentimentStatistic(positive=pos_pct, negative=neg_pct, neutral=neu_pct)
 
-        # Find dominant emotion
-        dominant_emotion = max(emotion_stats.items(), key=lambda x: x[1].count)[0]
-
         # Generate insights
         insights = self._generate_insights(
             emotion_stats=emotion_stats,
@@ -293,6 +302,7 @@ class EmotionService:
             active_days=active_days,
             total_days_in_month=(end_date - start_date).days,
             month=month,
+            dominant_emotion=dominant_emotion,
         )
 
         logger.info(
@@ -321,6 +331,7 @@ class EmotionService:
         active_days: int,
         total_days_in_month: int,
         month: str,
+        dominant_emotion: str | None = None,
     ) -> list[MonthlyInsight]:
         """
         Generate actionable insights from statistics.
@@ -331,6 +342,7 @@ class EmotionService:
             active_days: Days with activity
             total_days_in_month: Total days in the month
             month: Month identifier (YYYY-MM)
+            dominant_emotion: Most frequent emotion, if already known
 
         Returns:
             List of insights with icons and messages
@@ -363,12 +375,14 @@ class EmotionService:
         # Insight 2: Dominant emotion
         from domain.enums.emotion_emojis import EMOTION_EMOJIS
 
-        dominant = max(emotion_stats.items(), key=lambda x: x[1].percentage)
-        icon = EMOTION_EMOJIS.get(dominant[0], "💭")
+        if dominant_emotion is None:
+            dominant_emotion = max(emotion_stats, key=lambda name: emotion_stats[name].percentage)
+        dominant_pct = emotion_stats[dominant_emotion].percentage
+        icon = EMOTION_EMOJIS.get(dominant_emotion, "💭")
         insights.append(
             MonthlyInsight(
                 type="dominant_emotion",
-                message=f"{icon} Emozione più frequente: {dominant[0]} ({dominant[1].percentage}%)",
+                message=f"{icon} Emozione più frequente: {dominant_emotion} ({dominant_pct}%)",
                 icon=icon,
             )
         )
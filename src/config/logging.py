@@ -1,6 +1,9 @@
 """Structured logging configuration."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Any
 
@@ -9,6 +12,9 @@ from structlog.types import Processor
 
 from .settings import get_settings
 
+# Background listener that owns the real output handler (started once per process)
+_queue_listener: logging.handlers.QueueListener | None = None
+
 
 def setup_logging(service_name: str | None = None) -> None:
     """Configure structured logging with structlog.
@@ -19,7 +25,10 @@ def setup_logging(service_name: str | None = None) -> None:
     settings = get_settings()
 
     # Define log processors
+    # filter_by_level runs first so events below the configured level are dropped
+    # before any timestamping/rendering work is done for them.
     shared_processors: list[Processor] = [
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
@@ -51,11 +60,7 @@ def setup_logging(service_name: str | None = None) -> None:
     )
 
     # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, settings.log_level),
-    )
+    _configure_queue_logging(getattr(logging, settings.log_level))
 
     # Set log levels for noisy libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -70,6 +75,36 @@ def setup_logging(service_name: str | None = None) -> None:
         structlog.contextvars.bind_contextvars(service=service_name)
 
 
+def _configure_queue_logging(level: int) -> None:
+    """Route stdlib logging through a queue drained by a dedicated I/O thread.
+
+    Callers only enqueue the record; the stdout write happens on the
+    QueueListener thread, so slow or blocked output never stalls a request.
+
+    Args:
+        level: Root log level
+    """
+    global _queue_listener
+
+    root = logging.getLogger()
+    root.setLevel(level)
+
+    if _queue_listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+
+
 def get_logger(name: str) -> Any:
     """Get a structured logger instance.
 
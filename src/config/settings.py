@@ -6,6 +6,10 @@ from typing import Literal
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Plain PostgreSQL URL schemes that should be served by the psycopg 3 driver
+_POSTGRES_SCHEMES = ("postgresql://", "postgres://")
+_PSYCOPG_SCHEME = "postgresql+psycopg://"
+
 
 class Settings(BaseSettings):
     """Main application settings with validation."""
@@ -96,6 +100,15 @@ class Settings(BaseSettings):
         description="Allowed CORS origins",
     )
 
+    # Audit log
+    audit_read_requests: bool = Field(
+        default=True,
+        description=(
+            "Audit read-only requests (GET/HEAD/OPTIONS) too; they include reads of users' "
+            "emotion history, so only disable where that access need not be recorded"
+        ),
+    )
+
     # Monitoring
     prometheus_enabled: bool = Field(default=True, description="Enable Prometheus metrics")
     prometheus_port: int = Field(
@@ -131,13 +144,15 @@ class Settings(BaseSettings):
         return v
 
     def get_database_url(self) -> str:
-        """Get PostgreSQL connection URL."""
-        if self.database_url:
-            return self.database_url
-        return (
+        """Get PostgreSQL connection URL (using the psycopg 3 driver)."""
+        url = self.database_url or (
             f"postgresql://{self.db_user}:{self.db_password}"
             f"@{self.db_host}:{self.db_port}/{self.db_name}"
         )
+        for scheme in _POSTGRES_SCHEMES:
+            if url.startswith(scheme):
+                return _PSYCOPG_SCHEME + url[len(scheme) :]
+        return url
 
     def get_redis_url(self) -> str:
         """Get Redis connection URL."""
@@ -11,7 +11,7 @@ from ..enums.sentiment_type import SentimentType
 from ..value_objects.emotion_score import EmotionScore
 
 
-@dataclass
+@dataclass(slots=True)
 class EmotionRecord:
     """Emotion analysis record entity.
 
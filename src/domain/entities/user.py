@@ -7,7 +7,7 @@ from uuid import UUID, uuid4
 from ..value_objects.user_id import UserId
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User entity representing a Telegram bot user.
 
@@ -43,9 +43,14 @@ class User:
             is_active=True,
         )
 
-    def update_last_seen(self) -> None:
-        """Update last_seen_at timestamp."""
+    def update_last_seen(self) -> datetime:
+        """Update last_seen_at timestamp.
+
+        Returns:
+            The new last_seen_at value
+        """
         self.last_seen_at = datetime.now(UTC)
+        return self.last_seen_at
 
     def deactivate(self) -> None:
         """Deactivate user account."""
@@ -0,0 +1,4 @@
+"""Shared helpers for parsing model output labels."""
+
+# Whitespace and trailing punctuation LLMs add around a one-word answer ("Joy.")
+LABEL_STRIP = " \t\n.!\"'"
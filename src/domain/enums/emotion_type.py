@@ -2,6 +2,8 @@
 
 from enum import StrEnum
 
+from ._labels import LABEL_STRIP
+
 
 class EmotionType(StrEnum):
     """Supported emotion types."""
@@ -31,11 +33,7 @@ class EmotionType(StrEnum):
         Returns:
             EmotionType enum value
         """
-        label_lower = label.lower().strip()
-        try:
-            return cls(label_lower)
-        except ValueError:
-            return cls.UNKNOWN
+        return _EMOTION_LABELS.get(label.strip(LABEL_STRIP).lower(), cls.UNKNOWN)
 
     @property
     def is_negative(self) -> bool:
@@ -51,3 +49,14 @@ class EmotionType(StrEnum):
     def is_neutral(self) -> bool:
         """Check if emotion is neutral."""
         return self in {self.NEUTRAL, self.UNKNOWN}
+
+
+# Label -> member lookup (one dict hit per prediction), plus common model synonyms
+_EMOTION_LABELS: dict[str, EmotionType] = {member.value: member for member in EmotionType} | {
+    "happy": EmotionType.JOY,
+    "happiness": EmotionType.JOY,
+    "angry": EmotionType.ANGER,
+    "sad": EmotionType.SADNESS,
+    "afraid": EmotionType.FEAR,
+    "scared": EmotionType.FEAR,
+}
@@ -2,6 +2,8 @@
 
 from enum import StrEnum
 
+from ._labels import LABEL_STRIP
+
 
 class SentimentType(StrEnum):
     """Supported sentiment types."""
@@ -21,8 +23,8 @@ class SentimentType(StrEnum):
         Returns:
             SentimentType enum value
         """
-        label_lower = label.lower().strip()
-        try:
-            return cls(label_lower)
-        except ValueError:
-            return cls.UNKNOWN
+        return _SENTIMENT_LABELS.get(label.strip(LABEL_STRIP).lower(), cls.UNKNOWN)
+
+
+# Label -> member lookup (one dict hit per prediction)
+_SENTIMENT_LABELS: dict[str, SentimentType] = {member.value: member for member in SentimentType}
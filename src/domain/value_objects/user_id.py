@@ -2,9 +2,23 @@
 
 import hashlib
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=4096)
+def _hash_telegram(telegram_id: str) -> str:
+    """Compute SHA-256 hash of telegram_id (memoized for recurring senders).
+
+    Args:
+        telegram_id: Telegram user ID
+
+    Returns:
+        Hex-encoded SHA-256 hash
+    """
+    return hashlib.sha256(telegram_id.encode()).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
 class UserId:
     """Immutable value object representing a Telegram user ID.
 
@@ -45,7 +59,7 @@ class UserId:
         Returns:
             Hex-encoded SHA-256 hash
         """
-        return hashlib.sha256(telegram_id.encode()).hexdigest()
+        return _hash_telegram(telegram_id)
 
     @classmethod
     def from_telegram(cls, telegram_id: str | int) -> "UserId":
@@ -1,8 +1,10 @@
 """Cache infrastructure layer."""
 
+from .memory_cache import TTLCache
 from .redis_cache import RedisCache, get_cache
 
 __all__ = [
     "RedisCache",
+    "TTLCache",
     "get_cache",
 ]
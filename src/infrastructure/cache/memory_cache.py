@@ -0,0 +1,90 @@
+"""In-process LRU cache with per-entry TTL."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache with time-based expiry.
+
+    Complements RedisCache for hot, process-local lookups where even a Redis
+    round-trip is too expensive. Not thread-safe: intended for use from the
+    asyncio event loop thread.
+
+    Features:
+    - Least-recently-used eviction once maxsize is reached
+    - Per-entry expiry (monotonic clock)
+    - Hit/miss counters (see stats())
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Time-to-live in seconds for each entry
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Get value from cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing/expired
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store value in cache, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dict with hits, misses and current size
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data)}
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        """Number of stored entries (including not yet purged expired ones)."""
+        return len(self._data)
@@ -1,8 +1,8 @@
 """Redis cache implementation for performance optimization."""
 
-import json
 from typing import Any
 
+import orjson
 import redis
 from redis import Redis
 from redis.exceptions import RedisError
@@ -31,12 +31,16 @@ class RedisCache:
         Args:
             redis_client: Optional Redis client (for testing/DI)
         """
+        # Resolve settings once; set() reads the default TTL on every call
+        self._url = settings.get_redis_url()
+        self._default_ttl = settings.redis_cache_ttl
+
         if redis_client is not None:
             self._client = redis_client
         else:
             # Create Redis client with connection pooling and retry logic
             self._client = redis.from_url(
-                settings.get_redis_url(),
+                self._url,
                 decode_responses=False,  # We handle encoding/decoding ourselves
                 socket_connect_timeout=10,  # 5 → 10s for Render free tier
                 socket_timeout=10,  # 5 → 10s
@@ -46,7 +50,7 @@ class RedisCache:
                 health_check_interval=30,  # Check connections every 30s
             )
 
-        logger.info("Redis cache initialized with connection pool", url=settings.get_redis_url())
+        logger.info("Redis cache initialized with connection pool", url=self._url)
 
     def get(self, key: str) -> Any | None:
         """
@@ -65,14 +69,14 @@ class RedisCache:
                 return None
 
             # Deserialize JSON
-            deserialized = json.loads(value)
+            deserialized = orjson.loads(value)
             logger.debug("Cache hit", key=key)
             return deserialized
 
         except RedisError as e:
             logger.error("Redis get error (degrading gracefully)", key=key, error=str(e))
             return None
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error("JSON decode error in cache", key=key, error=str(e))
             return None
 
@@ -94,18 +98,18 @@ class RedisCache:
             True if successful, False otherwise
         """
         try:
-            # Serialize to JSON
-            serialized = json.dumps(value)
+            # Serialize to JSON (bytes; int dict keys become strings, as with json.dumps)
+            serialized = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
 
             # Use default TTL if not specified
-            ttl_seconds = ttl if ttl is not None else settings.redis_cache_ttl
+            ttl_seconds = ttl if ttl is not None else self._default_ttl
 
             # Set with expiration
             self._client.setex(key, ttl_seconds, serialized)
             logger.debug("Cache set", key=key, ttl=ttl_seconds)
             return True
 
-        except (RedisError, TypeError, json.JSONEncodeError) as e:
+        except (RedisError, orjson.JSONEncodeError) as e:
             logger.error("Redis set error", key=key, error=str(e))
             return False
 
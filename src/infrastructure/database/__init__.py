@@ -6,10 +6,17 @@ from sqlalchemy.orm import Session
 
 from .connection import (
     close_database,
+    enqueue_audit,
+    enqueue_last_seen,
+    ensure_monthly_partitions,
+    get_async_db_session,
+    get_async_engine,
     get_db_session,
     get_engine,
     health_check,
     init_database,
+    start_partition_maintenance,
+    start_write_flusher,
 )
 from .encryption import FieldEncryption, get_encryption
 from .models import APIKeyModel, AuditLogModel, Base, EmotionModel, UserModel
@@ -42,8 +49,15 @@ __all__ = [
     "get_engine",
     "get_db_session",
     "get_db",  # FastAPI dependency
+    "get_async_engine",
+    "get_async_db_session",
     "init_database",
     "close_database",
+    "enqueue_audit",
+    "enqueue_last_seen",
+    "ensure_monthly_partitions",
+    "start_partition_maintenance",
+    "start_write_flusher",
     "health_check",
     # Encryption
     "FieldEncryption",
@@ -1,103 +1,209 @@
 """Database connection management with SQLAlchemy 2.0."""
 
+import asyncio
+import itertools
+import logging
 import time
-from collections.abc import Generator
-from contextlib import contextmanager
-
-from sqlalchemy import create_engine, event, text
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
+from datetime import UTC, date, datetime
+from datetime import time as dt_time
+from functools import cache
+from typing import Any
+from uuid import UUID
+
+from prometheus_client import Counter
+from psycopg import sql
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Executable,
+    Insert,
+    Table,
+    and_,
+    cast,
+    column,
+    create_engine,
+    delete,
+    event,
+    func,
+    insert,
+    select,
+    text,
+    update,
+)
+from sqlalchemy import table as table_clause
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from config import get_logger, get_settings
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Connection settings resolved once at import (settings are fixed per process)
+_DB_URL = settings.get_database_url()
+_IS_POOLER = "-pooler" in _DB_URL  # NeonDB pooler endpoint (pgbouncer)
+_ECHO = settings.db_echo
+
+# Query timing: slow queries always warn, fast ones are logged 1 in 1024 at DEBUG
+_SLOW_QUERY_NS = 1_000_000_000  # 1 second
+_QUERY_LOG_SAMPLE_MASK = 1023
+_query_counter = itertools.count()
+
+# Write-behind queue for non-critical writes (audit log, last-seen), flushed in batches
+_WRITE_QUEUE_MAXSIZE = 10_000
+_WRITE_BATCH_SIZE = 500
+_WRITE_DRAIN_TIMEOUT = 5.0  # seconds
+_WRITE_LINGER = 0.5  # seconds to gather more rows after the first one of a batch
+_WRITE_COPY_THRESHOLD = 100  # inserts of at least this many rows go through COPY
+_write_queue: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue(
+    maxsize=_WRITE_QUEUE_MAXSIZE
+)
+_write_flusher: asyncio.Task[None] | None = None
+
+write_queue_dropped_total = Counter(
+    "happykube_write_queue_dropped_total",
+    "Write-behind rows dropped because the queue was full",
+    ["kind"],
+)
+
+# Range-partitioned by month on created_at (see ensure_monthly_partitions)
+_PARTITIONED_TABLES = ("emotions", "audit_log")
+_PARTITION_MAINTENANCE_INTERVAL = 6 * 3600  # seconds
+_partition_maintenance: asyncio.Task[None] | None = None
+
+
+def _engine_options() -> dict[str, Any]:
+    """
+    Build engine keyword arguments shared by the sync and async engines.
 
-# Global engine instance (created once)
-_engine: Engine | None = None
-_session_factory: sessionmaker[Session] | None = None
-
+    The NeonDB '-pooler' endpoint is pgbouncer in transaction mode: it already
+    pools server connections, and server-side prepared statements do not
+    survive across its transactions. For that endpoint, skip the client-side
+    pool (NullPool) and disable psycopg's automatic statement preparation.
+    Direct endpoints keep the tuned QueuePool and let psycopg prepare hot
+    statements server-side (e.g. INSERT INTO emotions) after a few executions.
 
+    Returns:
+        Keyword arguments for create_engine / create_async_engine
+    """
+    connect_args: dict[str, Any] = {"connect_timeout": 10}
+
+    if _IS_POOLER:
+        connect_args["prepare_threshold"] = None  # No prepared statements via pgbouncer
+        return {
+            "poolclass": NullPool,
+            "echo": _ECHO,
+            "connect_args": connect_args,
+        }
+
+    # NeonDB pooler doesn't support statement_timeout in options
+    connect_args["options"] = "-c statement_timeout=30000"  # 30s query timeout
+    # Server-side prepare after 5 executions of the same query: skips parse/plan
+    connect_args["prepare_threshold"] = 5
+    # TCP keepalives keep idle pooled connections alive through NAT / the Neon proxy
+    connect_args.update(
+        keepalives=1, keepalives_idle=30, keepalives_interval=10, keepalives_count=3
+    )
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,  # Verify connections before using
+        "pool_recycle": 300,  # Recycle after 5min (NeonDB serverless optimization)
+        "echo": _ECHO,  # Log SQL queries if enabled
+        "connect_args": connect_args,
+    }
+
+
+@cache
 def get_engine() -> Engine:
     """
     Get or create SQLAlchemy engine with connection pooling.
 
+    Cached after the first call; close_database() clears the cache.
+
     Returns:
         SQLAlchemy Engine instance
     """
-    global _engine
-
-    if _engine is None:
-        logger.info(
-            "Creating database engine",
-            host=settings.db_host,
-            database=settings.db_name,
-            pool_size=settings.db_pool_size,
-        )
-
-        # Build connect_args based on database type
-        db_url = settings.get_database_url()
-        connect_args = {"connect_timeout": 10}
-
-        # NeonDB pooler doesn't support statement_timeout in options
-        # Check if using NeonDB pooler (contains '-pooler' in hostname)
-        if "-pooler" not in db_url:
-            connect_args["options"] = "-c statement_timeout=30000"  # 30s query timeout
-
-        # Create engine with connection pooling optimized for NeonDB
-        _engine = create_engine(
-            db_url,
-            pool_size=settings.db_pool_size,
-            max_overflow=settings.db_max_overflow,
-            pool_pre_ping=True,  # Verify connections before using
-            pool_recycle=300,  # Recycle after 5min (NeonDB serverless optimization)
-            echo=settings.db_echo,  # Log SQL queries if enabled
-            connect_args=connect_args,
-        )
-
-        # Add connection event listeners for debugging
-        @event.listens_for(_engine, "connect")
-        def receive_connect(dbapi_conn, connection_record):  # type: ignore
-            """Log when new connection is established."""
-            logger.debug("Database connection established")
-
-        @event.listens_for(_engine, "close")
-        def receive_close(dbapi_conn, connection_record):  # type: ignore
-            """Log when connection is closed."""
-            logger.debug("Database connection closed")
-
-        # Query logging (only in production when db_echo is False)
-        if not settings.db_echo:
-
-            @event.listens_for(_engine, "before_cursor_execute")
-            def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # type: ignore
-                """Record query start time."""
-                conn.info.setdefault("query_start_time", []).append(time.time())
-                # Log query (parameters are sanitized - not logged for security)
+    logger.info(
+        "Creating database engine",
+        host=settings.db_host,
+        database=settings.db_name,
+        pool="null (pgbouncer)" if _IS_POOLER else "queue",
+        pool_size=settings.db_pool_size,
+    )
+
+    engine = create_engine(_DB_URL, **_engine_options())
+
+    # Add connection event listeners for debugging
+    @event.listens_for(engine, "connect")
+    def receive_connect(dbapi_conn, connection_record):  # type: ignore
+        """Log when new connection is established."""
+        logger.debug("Database connection established")
+
+    @event.listens_for(engine, "close")
+    def receive_close(dbapi_conn, connection_record):  # type: ignore
+        """Log when connection is closed."""
+        logger.debug("Database connection closed")
+
+    # Query logging (only in production when db_echo is False)
+    if not _ECHO:
+        # Level is checked once here instead of per statement; hot-path
+        # callables are bound as default arguments (locals, not globals).
+        # (stdlib logger: the structlog proxy has no isEnabledFor before setup_logging())
+        debug_enabled = logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def before_cursor_execute(  # type: ignore
+            conn, cursor, statement, parameters, context, executemany, _now=time.perf_counter_ns
+        ):
+            """Record query start time."""
+            conn.info.setdefault("query_start_ns", []).append(_now())
+            # Log query (parameters are sanitized - not logged for security)
+            if debug_enabled:
                 logger.debug(
-                    "Executing query", query_preview=statement[:100], has_params=bool(parameters)
+                    "Executing query",
+                    query_preview=statement[:100],
+                    has_params=bool(parameters),
                 )
 
-            @event.listens_for(_engine, "after_cursor_execute")
-            def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # type: ignore
-                """Log query execution time."""
-                total_time = time.time() - conn.info["query_start_time"].pop(-1)
-                # Log slow queries (> 1 second) with more detail
-                if total_time > 1.0:
-                    logger.warning(
-                        "Slow query detected",
-                        duration_ms=round(total_time * 1000, 2),
-                        query_preview=statement[:200],
-                    )
-                else:
-                    logger.debug("Query completed", duration_ms=round(total_time * 1000, 2))
+        @event.listens_for(engine, "after_cursor_execute")
+        def after_cursor_execute(  # type: ignore
+            conn,
+            cursor,
+            statement,
+            parameters,
+            context,
+            executemany,
+            _now=time.perf_counter_ns,
+            _counter=_query_counter,
+        ):
+            """Log slow queries, and a sample of completed queries at DEBUG."""
+            elapsed_ns = _now() - conn.info["query_start_ns"].pop(-1)
+            # Log slow queries (> 1 second) with more detail
+            if elapsed_ns > _SLOW_QUERY_NS:
+                logger.warning(
+                    "Slow query detected",
+                    duration_ms=round(elapsed_ns / 1_000_000, 2),
+                    query_preview=statement[:200],
+                )
+            elif debug_enabled and not next(_counter) & _QUERY_LOG_SAMPLE_MASK:
+                logger.debug("Query completed", duration_ms=round(elapsed_ns / 1_000_000, 2))
 
-        logger.info("Database engine created successfully")
+    logger.info("Database engine created successfully")
 
-    return _engine
+    return engine
 
 
+@cache
 def get_session_factory() -> sessionmaker[Session]:
     """
     Get or create session factory.
@@ -105,19 +211,14 @@ def get_session_factory() -> sessionmaker[Session]:
     Returns:
         SQLAlchemy sessionmaker
     """
-    global _session_factory
-
-    if _session_factory is None:
-        engine = get_engine()
-        _session_factory = sessionmaker(
-            bind=engine,
-            autocommit=False,
-            autoflush=False,
-            expire_on_commit=False,  # Don't expire objects after commit
-        )
-        logger.info("Session factory created")
-
-    return _session_factory
+    factory = sessionmaker(
+        bind=get_engine(),
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,  # Don't expire objects after commit
+    )
+    logger.info("Session factory created")
+    return factory
 
 
 @contextmanager
@@ -156,6 +257,290 @@ def get_db_session() -> Generator[Session, None, None]:
         logger.debug("Database session closed")
 
 
+@cache
+def get_async_engine() -> AsyncEngine:
+    """
+    Get or create the async SQLAlchemy engine.
+
+    Uses the same psycopg 3 URL as the sync engine; psycopg provides both the
+    sync and asyncio drivers, so no separate DBAPI is needed.
+
+    Returns:
+        SQLAlchemy AsyncEngine instance
+    """
+    logger.info(
+        "Creating async database engine",
+        host=settings.db_host,
+        database=settings.db_name,
+        pool="null (pgbouncer)" if _IS_POOLER else "queue",
+        pool_size=settings.db_pool_size,
+    )
+
+    engine = create_async_engine(_DB_URL, **_engine_options())
+    logger.info("Async database engine created successfully")
+    return engine
+
+
+@cache
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Get or create async session factory.
+
+    Returns:
+        SQLAlchemy async_sessionmaker
+    """
+    factory = async_sessionmaker(
+        get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    logger.info("Async session factory created")
+    return factory
+
+
+@asynccontextmanager
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async context manager for database sessions.
+
+    Same commit/rollback semantics as get_db_session, but database I/O is
+    awaited instead of blocking the event loop.
+
+    Usage:
+        async with get_async_db_session() as session:
+            await session.execute(stmt)
+            # Commit happens automatically
+
+    Yields:
+        SQLAlchemy AsyncSession
+
+    Raises:
+        Exception: Any database error (session is rolled back)
+    """
+    factory = get_async_session_factory()
+
+    async with factory() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception as e:
+            logger.error("Async database session error, rolling back", error=str(e))
+            await session.rollback()
+            raise
+
+
+def _batch_statements(
+    batch: list[tuple[str, dict[str, Any]]],
+) -> list[tuple[Executable, list[dict[str, Any]]]]:
+    """
+    Turn queued write-behind rows into one executemany statement per kind.
+
+    Last-seen updates for the same user are collapsed to the latest timestamp.
+
+    Args:
+        batch: Queued (kind, row) tuples
+
+    Returns:
+        List of (statement, parameter rows) pairs
+    """
+    from .models import AuditLogModel, UserModel
+
+    audit_rows: list[dict[str, Any]] = []
+    last_seen: dict[UUID, datetime] = {}
+
+    for kind, row in batch:
+        if kind == "audit":
+            audit_rows.append(row)
+        else:
+            seen_at = last_seen.get(row["id"])
+            if seen_at is None or row["last_seen_at"] > seen_at:
+                last_seen[row["id"]] = row["last_seen_at"]
+
+    statements: list[tuple[Executable, list[dict[str, Any]]]] = []
+    if audit_rows:
+        statements.append((insert(AuditLogModel), audit_rows))
+    if last_seen:
+        statements.append(
+            (
+                update(UserModel),
+                [{"id": user_id, "last_seen_at": ts} for user_id, ts in last_seen.items()],
+            )
+        )
+    return statements
+
+
+async def _copy_rows(session: AsyncSession, table_name: str, rows: list[dict[str, Any]]) -> None:
+    """
+    Insert rows with COPY FROM STDIN on the session's connection.
+
+    COPY streams rows without per-row statement parse/plan/bind, which
+    beats executemany INSERTs on large batches. Rows are grouped by the set
+    of columns they carry and each group is copied with exactly those
+    columns, so columns a row leaves out (e.g. the id) get their server
+    defaults rather than NULL.
+
+    Args:
+        session: Async session whose transaction the COPY joins
+        table_name: Target table
+        rows: Column values
+    """
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(row), []).append(row)
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if driver_connection is None:
+        raise RuntimeError("Database connection is no longer available for COPY")
+
+    async with driver_connection.cursor() as cursor:
+        for columns, group in groups.items():
+            statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+                sql.Identifier(table_name), sql.SQL(", ").join(map(sql.Identifier, columns))
+            )
+            async with cursor.copy(statement) as copy:
+                for row in group:
+                    await copy.write_row([row[column] for column in columns])
+
+
+async def _flush_writes(batch: list[tuple[str, dict[str, Any]]]) -> None:
+    """Write a batch of queued rows in a single transaction."""
+    try:
+        async with get_async_db_session() as session:
+            # Short OLTP writes: never pay for LLVM JIT compilation (transaction-scoped,
+            # so safe through the pgbouncer pooler too)
+            await session.execute(text("SET LOCAL jit = off"))
+            for stmt, rows in _batch_statements(batch):
+                if isinstance(stmt, Insert) and len(rows) >= _WRITE_COPY_THRESHOLD:
+                    await _copy_rows(session, stmt.table.name, rows)
+                else:
+                    await session.execute(stmt, rows)
+        logger.debug("Write-behind batch flushed", rows=len(batch))
+    except Exception as e:
+        logger.error("Write-behind flush failed", error=str(e), rows=len(batch))
+
+
+async def _write_flusher_loop() -> None:
+    """
+    Consume the write-behind queue.
+
+    A batch is flushed once it holds _WRITE_BATCH_SIZE rows or _WRITE_LINGER
+    seconds after its first row arrived, whichever comes first, so one
+    commit covers every request in that window.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _write_queue.get()]
+        deadline = loop.time() + _WRITE_LINGER
+        while len(batch) < _WRITE_BATCH_SIZE:
+            try:
+                batch.append(_write_queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_write_queue.get(), remaining))
+            except TimeoutError:
+                break
+
+        await _flush_writes(batch)
+        for _ in batch:
+            _write_queue.task_done()
+
+
+def start_write_flusher() -> None:
+    """
+    Start the write-behind flusher task on the running event loop (idempotent).
+
+    Called from the application lifespan; enqueueing also starts it lazily.
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    global _write_flusher
+
+    if _write_flusher is None or _write_flusher.done():
+        _write_flusher = asyncio.get_running_loop().create_task(_write_flusher_loop())
+        logger.info("Write-behind flusher started")
+
+
+def _enqueue_write(kind: str, row: dict[str, Any]) -> None:
+    """
+    Queue a row for the background flusher.
+
+    Starts the flusher on first use. Outside an event loop (scripts, CLI),
+    the row is written synchronously instead. When the queue is full the
+    oldest pending row is dropped and counted in
+    happykube_write_queue_dropped_total.
+
+    Args:
+        kind: "audit" or "last_seen"
+        row: Column values
+    """
+    try:
+        start_write_flusher()
+    except RuntimeError:
+        with get_db_session() as session:
+            for stmt, rows in _batch_statements([(kind, row)]):
+                session.execute(stmt, rows)
+        return
+
+    if _write_queue.full():
+        # Keep memory bounded under a slow database: shed the oldest row, not the newest
+        dropped_kind, _ = _write_queue.get_nowait()
+        _write_queue.task_done()
+        write_queue_dropped_total.labels(kind=dropped_kind).inc()
+        logger.warning("Write-behind queue full, dropping oldest row", kind=dropped_kind)
+
+    _write_queue.put_nowait((kind, row))
+
+
+def enqueue_audit(**fields: Any) -> None:
+    """
+    Queue an audit log row instead of inserting it in the request path.
+
+    Args:
+        **fields: AuditLogModel column values
+    """
+    _enqueue_write("audit", fields)
+
+
+def enqueue_last_seen(user_id: UUID, last_seen_at: datetime) -> None:
+    """
+    Queue a last_seen_at update for a user.
+
+    Args:
+        user_id: User UUID
+        last_seen_at: New last-seen timestamp
+    """
+    _enqueue_write("last_seen", {"id": user_id, "last_seen_at": last_seen_at})
+
+
+async def _stop_write_flusher() -> None:
+    """Drain pending write-behind rows and stop the flusher task."""
+    global _write_flusher
+
+    if _write_flusher is None:
+        return
+
+    try:
+        await asyncio.wait_for(_write_queue.join(), timeout=_WRITE_DRAIN_TIMEOUT)
+    except TimeoutError:
+        logger.warning("Write-behind drain timed out", pending=_write_queue.qsize())
+
+    _write_flusher.cancel()
+    try:
+        await _write_flusher
+    except asyncio.CancelledError:
+        pass
+    _write_flusher = None
+    logger.info("Write-behind flusher stopped")
+
+
 def init_database() -> None:
     """
     Initialize database tables (create if not exists).
@@ -170,29 +555,195 @@ def init_database() -> None:
 
     try:
         Base.metadata.create_all(bind=engine)
+        ensure_monthly_partitions()
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error("Failed to create database tables", error=str(e))
         raise
 
 
-def close_database() -> None:
+def _next_month(month: date) -> date:
+    """First day of the month after the given first-of-month date."""
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _partitioned_table(name: str) -> Table:
+    """Look up the ORM table definition of a partitioned parent table."""
+    from .models import Base
+
+    return Base.metadata.tables[name]
+
+
+def _create_monthly_partition(table: str, month: date) -> bool:
+    """
+    Create one monthly partition of table, in its own transaction.
+
+    PostgreSQL refuses a new partition while the DEFAULT partition holds rows
+    in its range (i.e. partition creation ran late). In that case the default
+    partition is detached, the partition created, the stranded rows moved
+    into it, and the default partition re-attached - all in one transaction.
+
+    Args:
+        table: Partitioned parent table
+        month: First day of the month to cover
+
+    Returns:
+        True if the partition was created, False if it already existed
+    """
+    partition = f"{table}_{month:%Y_%m}"
+    default = f"{table}_default"
+    start = datetime.combine(month, dt_time(), UTC)
+    end = datetime.combine(_next_month(month), dt_time(), UTC)
+
+    # Lightweight handles on the partitions (same columns as the parent)
+    names = [c.name for c in _partitioned_table(table).columns]
+    default_table = table_clause(default, *map(column, names))
+    partition_table = table_clause(partition, *map(column, names))
+    in_range = and_(default_table.c.created_at >= start, default_table.c.created_at < end)
+
+    with get_db_session() as session:
+        if session.scalar(text("SELECT to_regclass(:name)"), {"name": partition}) is not None:
+            return False
+
+        # Blocks inserts (into every partition) so no row can land in the
+        # default partition between the check below and the CREATE
+        session.execute(text(f"LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE"))
+        # DDL takes no bind parameters: the bounds are dates we formatted ourselves
+        create = text(
+            f"CREATE TABLE {partition} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        stranded = session.scalar(select(func.count()).select_from(default_table).where(in_range))
+        if not stranded:
+            session.execute(create)
+            return True
+
+        session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {default}"))
+        session.execute(create)
+        moved = delete(default_table).where(in_range).returning(*default_table.c).cte("moved")
+        session.execute(insert(partition_table).from_select(names, select(*moved.c)))
+        session.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT"))
+
+    logger.warning(
+        "Moved rows from default partition into new monthly partition",
+        partition=partition,
+        rows=stranded,
+    )
+    return True
+
+
+def ensure_monthly_partitions(months_ahead: int = 2) -> None:
     """
-    Close database connections and dispose engine.
+    Create monthly partitions of the time-series tables (emotions, audit_log).
+
+    Covers the current month, months_ahead more, and any month whose rows
+    already fell into the table's <table>_default partition (moved out into
+    their own partition). Every partition is created in its own transaction,
+    so one failure does not roll back the others; failures are logged and
+    retried on the next run. Idempotent: runs at startup and then every
+    _PARTITION_MAINTENANCE_INTERVAL (see start_partition_maintenance).
+
+    Args:
+        months_ahead: Number of future months to pre-create
+    """
+    this_month = datetime.now(UTC).date().replace(day=1)
+    upcoming = [this_month]
+    for _ in range(months_ahead):
+        upcoming.append(_next_month(upcoming[-1]))
+
+    created: list[str] = []
+    for table in _PARTITIONED_TABLES:
+        try:
+            with get_db_session() as session:
+                session.execute(
+                    text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT")
+                )
+                created_at = column("created_at", DateTime)
+                month_of = cast(func.date_trunc("month", func.timezone("UTC", created_at)), Date)
+                stranded = session.scalars(
+                    select(month_of)
+                    .distinct()
+                    .select_from(table_clause(f"{table}_default", created_at))
+                ).all()
+        except Exception as e:
+            logger.error("Failed to inspect default partition", table=table, error=str(e))
+            continue
+
+        for month in sorted(set(upcoming).union(stranded)):
+            try:
+                if _create_monthly_partition(table, month):
+                    created.append(f"{table}_{month:%Y_%m}")
+            except Exception as e:
+                logger.error(
+                    "Failed to create monthly partition",
+                    table=table,
+                    month=f"{month:%Y-%m}",
+                    error=str(e),
+                )
+
+    logger.info("Monthly partitions ensured", tables=_PARTITIONED_TABLES, created=created)
+
+
+async def _partition_maintenance_loop() -> None:
+    """Run ensure_monthly_partitions now and then every _PARTITION_MAINTENANCE_INTERVAL."""
+    while True:
+        try:
+            await asyncio.to_thread(ensure_monthly_partitions)
+        except Exception as e:
+            logger.error("Partition maintenance failed", error=str(e))
+        await asyncio.sleep(_PARTITION_MAINTENANCE_INTERVAL)
+
+
+def start_partition_maintenance() -> None:
+    """
+    Start the periodic partition maintenance task on the running event loop (idempotent).
+
+    Long-running processes would otherwise outlive the partitions created at
+    startup and spill new rows into the default partitions.
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    global _partition_maintenance
+
+    if _partition_maintenance is None or _partition_maintenance.done():
+        _partition_maintenance = asyncio.get_running_loop().create_task(
+            _partition_maintenance_loop()
+        )
+        logger.info("Partition maintenance started")
+
+
+async def close_database() -> None:
+    """
+    Close database connections and dispose engines.
 
     Call this on application shutdown.
     """
-    global _engine, _session_factory
+    global _partition_maintenance
 
-    if _engine is not None:
+    if _partition_maintenance is not None:
+        _partition_maintenance.cancel()
+        _partition_maintenance = None
+
+    await _stop_write_flusher()
+
+    # currsize tells whether the cached engine was ever created
+    if get_engine.cache_info().currsize:
         logger.info("Closing database engine")
-        _engine.dispose()
-        _engine = None
-        _session_factory = None
+        get_engine().dispose()
+        get_session_factory.cache_clear()
+        get_engine.cache_clear()
         logger.info("Database engine closed")
 
+    if get_async_engine.cache_info().currsize:
+        logger.info("Closing async database engine")
+        await get_async_engine().dispose()
+        get_async_session_factory.cache_clear()
+        get_async_engine.cache_clear()
+        logger.info("Async database engine closed")
 
-def health_check() -> bool:
+
+async def health_check() -> bool:
     """
     Check if database connection is healthy.
 
@@ -200,9 +751,9 @@ def health_check() -> bool:
         True if database is reachable, False otherwise
     """
     try:
-        with get_db_session() as session:
+        async with get_async_db_session() as session:
             # Simple query to test connection
-            session.execute(text("SELECT 1"))
+            await session.execute(text("SELECT 1"))
         logger.debug("Database health check passed")
         return True
     except Exception as e:
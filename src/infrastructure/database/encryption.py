@@ -1,18 +1,32 @@
 """Field-level encryption for sensitive data (PII compliance)."""
 
+import base64
+import os
+
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from config import get_logger, get_settings
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Ciphertext framing: version byte + 96-bit nonce + AES-GCM ciphertext/tag.
+# Legacy Fernet tokens are base64 text starting with "gAAAAA", never 0x01.
+_AESGCM_VERSION = b"\x01"
+_NONCE_SIZE = 12
+_HKDF_INFO = b"happykube field encryption aes-256-gcm"
+
 
 class FieldEncryption:
     """
-    Handles AES-256 encryption/decryption for database fields.
+    Handles AES-256-GCM encryption/decryption for database fields.
 
-    Uses Fernet (symmetric encryption) with key from settings.
+    New values are encrypted with AES-256-GCM (key derived via HKDF from the
+    configured Fernet key). Values written before the switch are Fernet
+    tokens and are still decrypted transparently.
     All PII data (user text, etc.) is encrypted at rest.
     """
 
@@ -27,20 +41,29 @@ class FieldEncryption:
             ValueError: If encryption key is invalid
         """
         key = encryption_key or settings.encryption_key
+        if not key:
+            raise ValueError("Invalid encryption key: ENCRYPTION_KEY is not set")
 
         try:
             self._fernet = Fernet(key.encode())
+            aead_key = HKDF(
+                algorithm=hashes.SHA256(), length=32, salt=None, info=_HKDF_INFO
+            ).derive(base64.urlsafe_b64decode(key.encode()))
+            self._aead = AESGCM(aead_key)
+            # Bound once: encrypt/decrypt run for every stored/loaded record
+            self._encrypt = self._aead.encrypt
+            self._decrypt = self._aead.decrypt
             logger.info("Field encryption initialized successfully")
         except Exception as e:
             logger.error("Failed to initialize encryption", error=str(e))
             raise ValueError(f"Invalid encryption key: {e}") from e
 
-    def encrypt(self, plaintext: str) -> bytes:
+    def encrypt(self, plaintext: str | bytes) -> bytes:
         """
-        Encrypt plaintext string to bytes.
+        Encrypt plaintext to bytes.
 
         Args:
-            plaintext: Text to encrypt
+            plaintext: Text to encrypt (str is UTF-8 encoded, bytes are used as-is)
 
         Returns:
             Encrypted bytes
@@ -52,9 +75,9 @@ class FieldEncryption:
             return b""
 
         try:
-            encrypted = self._fernet.encrypt(plaintext.encode("utf-8"))
-            logger.debug("Text encrypted successfully", length=len(plaintext))
-            return encrypted
+            data = plaintext if isinstance(plaintext, bytes) else plaintext.encode("utf-8")
+            nonce = os.urandom(_NONCE_SIZE)
+            return _AESGCM_VERSION + nonce + self._encrypt(nonce, data, None)
         except Exception as e:
             logger.error("Encryption failed", error=str(e))
             raise ValueError(f"Encryption failed: {e}") from e
@@ -76,41 +99,48 @@ class FieldEncryption:
             return ""
 
         try:
-            decrypted = self._fernet.decrypt(ciphertext)
-            plaintext = decrypted.decode("utf-8")
-            logger.debug("Text decrypted successfully")
-            return plaintext
+            if ciphertext[:1] == _AESGCM_VERSION:
+                nonce = ciphertext[1 : 1 + _NONCE_SIZE]
+                return self._decrypt(nonce, ciphertext[1 + _NONCE_SIZE :], None).decode("utf-8")
+            # Legacy Fernet token (written before AES-GCM)
+            return self._fernet.decrypt(ciphertext).decode("utf-8")
         except Exception as e:
             logger.error("Decryption failed", error=str(e))
             raise ValueError(f"Decryption failed: {e}") from e
 
-    def encrypt_if_needed(self, value: str | bytes) -> bytes:
+    def decrypt_many(self, ciphertexts: list[bytes]) -> list[str]:
         """
-        Encrypt value if it's a string, return as-is if already bytes.
-
-        Args:
-            value: String or bytes
+        Decrypt a batch of values (e.g. every row of a list query).
 
-        Returns:
-            Encrypted bytes
-        """
-        if isinstance(value, bytes):
-            return value
-        return self.encrypt(value)
-
-    def decrypt_if_needed(self, value: bytes | str) -> str:
-        """
-        Decrypt value if it's bytes, return as-is if already string.
+        AES-GCM values are decrypted inline with the bound cipher; empty and
+        legacy Fernet values fall back to decrypt().
 
         Args:
-            value: Bytes or string
+            ciphertexts: Encrypted values
 
         Returns:
-            Decrypted string
+            Decrypted plaintexts, in input order
+
+        Raises:
+            ValueError: If any decryption fails
         """
-        if isinstance(value, str):
-            return value
-        return self.decrypt(value)
+        decrypt_aead = self._decrypt
+        body_start = 1 + _NONCE_SIZE
+        plaintexts: list[str] = []
+        append = plaintexts.append
+        try:
+            for ciphertext in ciphertexts:
+                if ciphertext[:1] == _AESGCM_VERSION:
+                    nonce = ciphertext[1:body_start]
+                    append(decrypt_aead(nonce, ciphertext[body_start:], None).decode("utf-8"))
+                else:
+                    append(self.decrypt(ciphertext))
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error("Decryption failed", error=str(e))
+            raise ValueError(f"Decryption failed: {e}") from e
+        return plaintexts
 
 
 # Singleton instance for application-wide use
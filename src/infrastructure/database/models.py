@@ -4,11 +4,48 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, Integer, LargeBinary, String, Text, func
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    event,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+# Time-ordered UUIDv7 (RFC 9562): 48-bit Unix ms timestamp, then random bits
+# taken from gen_random_uuid() with the version nibble switched from 4 to 7.
+# Sequential keys append to the right edge of the primary key B-tree.
+UUID_V7_FUNCTION = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(
+                        int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                        FROM 3
+                    )
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid
+$$ LANGUAGE sql VOLATILE
+"""
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -38,7 +75,6 @@ class UserModel(Base):
         String(64),
         unique=True,
         nullable=False,
-        index=True,
         comment="SHA-256 hash of Telegram user ID",
     )
 
@@ -69,19 +105,38 @@ class EmotionModel(Base):
     Emotion analysis records table.
 
     Stores emotion/sentiment analysis results with encrypted user text.
-    Partitioned by created_at for performance (manual setup required).
+    Range-partitioned by month on created_at; partitions are created at
+    startup and every few hours after by ensure_monthly_partitions() (see
+    connection.py).
     """
 
     __tablename__ = "emotions"
+    __table_args__ = (
+        # created_at grows with insertion order: BRIN is tiny and cheap to maintain
+        Index("ix_emotions_created_brin", "created_at", postgresql_using="brin"),
+        # Per-user timelines (reports, monthly stats); INCLUDE covers the report
+        # columns so find_report_rows can be answered by an index-only scan
+        Index(
+            "ix_emotions_user_created",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_include=["id", "emotion", "sentiment", "score", "model_type"],
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     # Primary key
+    # Generated by the database when not supplied (bulk inserts skip Python uuid4)
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid4, comment="Emotion record UUID"
+        PG_UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+        comment="Emotion record UUID",
     )
 
-    # Foreign key to users table
+    # Foreign key to users table (lookups use ix_emotions_user_created)
     user_id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), nullable=False, index=True, comment="Reference to users.id"
+        PG_UUID(as_uuid=True), nullable=False, comment="Reference to users.id"
     )
 
     # Encrypted user text (PII - AES-256 encrypted)
@@ -93,7 +148,6 @@ class EmotionModel(Base):
     emotion: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-        index=True,
         comment="Detected emotion (anger, joy, sadness, fear, etc.)",
     )
 
@@ -103,7 +157,6 @@ class EmotionModel(Base):
     model_type: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
-        index=True,
         comment="ML model used (italian_emotion, english_emotion, sentiment)",
     )
 
@@ -112,12 +165,12 @@ class EmotionModel(Base):
         String(20), nullable=True, comment="Sentiment classification (positive, negative, neutral)"
     )
 
-    # Timestamp (used for partitioning)
+    # Timestamp (partition key, so part of the primary key)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
         server_default=func.now(),
-        index=True,
         comment="Analysis timestamp (UTC)",
     )
 
@@ -144,6 +197,10 @@ class APIKeyModel(Base):
     """
 
     __tablename__ = "api_keys"
+    __table_args__ = (
+        # Auth lookups only ever consider active keys
+        Index("ix_api_keys_active_key_prefix", "key_prefix", postgresql_where=text("is_active")),
+    )
 
     # Primary key
     id: Mapped[UUID] = mapped_column(
@@ -152,7 +209,13 @@ class APIKeyModel(Base):
 
     # Bcrypt-hashed API key (never store plaintext!)
     key_hash: Mapped[str] = mapped_column(
-        String(64), unique=True, nullable=False, index=True, comment="Bcrypt hash of API key"
+        String(64), unique=True, nullable=False, comment="Bcrypt hash of API key"
+    )
+
+    # Non-secret lookup digest (SHA-256 prefix): finds the row to bcrypt-verify
+    # without scanning every key. NULL for keys created before it existed.
+    key_prefix: Mapped[str | None] = mapped_column(
+        String(16), nullable=True, comment="SHA-256 prefix of API key for lookup"
     )
 
     # Metadata
@@ -198,20 +261,39 @@ class AuditLogModel(Base):
     Audit log table for security tracking.
 
     Records all API access for forensics and compliance.
+    Range-partitioned by month on created_at, like emotions (same partition
+    maintenance, including moving rows that spilled into audit_log_default):
+    retention is a partition drop instead of a bulk DELETE.
     """
 
     __tablename__ = "audit_log"
+    __table_args__ = (
+        # Append-only log: BRIN on the insertion-ordered timestamp; 32-page ranges
+        # keep time-window scans tight inside a monthly partition
+        Index(
+            "ix_audit_log_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index("ix_audit_log_user_created", "user_id", text("created_at DESC")),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     # Primary key
+    # Generated by the database (write-behind batches never carry an id);
+    # UUIDv7 so append-only inserts stay on the rightmost index page
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid4, comment="Audit log entry UUID"
+        PG_UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("uuid_generate_v7()"),
+        comment="Audit log entry UUID (v7, time-ordered)",
     )
 
     # User reference (nullable for unauthenticated requests)
     user_id: Mapped[UUID | None] = mapped_column(
         PG_UUID(as_uuid=True),
         nullable=True,
-        index=True,
         comment="Reference to users.id (if authenticated)",
     )
 
@@ -234,12 +316,12 @@ class AuditLogModel(Base):
 
     user_agent: Mapped[str | None] = mapped_column(Text, nullable=True, comment="Client user agent")
 
-    # Timestamp
+    # Timestamp (partition key, so part of the primary key)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
         server_default=func.now(),
-        index=True,
         comment="Log entry timestamp (UTC)",
     )
 
@@ -249,3 +331,11 @@ class AuditLogModel(Base):
             f"<AuditLogModel(id={self.id}, action={self.action}, "
             f"user_id={self.user_id}, ip={self.ip_address})>"
         )
+
+
+# create_all (dev/tests) needs the UUIDv7 function before the audit_log table
+event.listen(
+    AuditLogModel.__table__,
+    "before_create",
+    DDL(UUID_V7_FUNCTION).execute_if(dialect="postgresql"),
+)
@@ -1,10 +1,23 @@
 """ML infrastructure layer - Groq integration."""
 
-from .groq_analyzer import GroqAnalyzer
+from typing import TYPE_CHECKING, Any
+
 from .model_factory import ModelFactory, get_model_factory
 
+if TYPE_CHECKING:
+    from .groq_analyzer import GroqAnalyzer
+
 __all__ = [
     "GroqAnalyzer",
     "ModelFactory",
     "get_model_factory",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import GroqAnalyzer lazily (only when a factory first needs it)."""
+    if name == "GroqAnalyzer":
+        from .groq_analyzer import GroqAnalyzer
+
+        return GroqAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,19 @@
 """Groq-based emotion and sentiment analyzer using Llama."""
 
+import asyncio
+import random
+import re
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
 import httpx
+import orjson
 
 from config import get_logger, get_settings
 from domain import EmotionScore, EmotionType, SentimentType
 from domain.enums import ModelType
+from infrastructure.cache.memory_cache import TTLCache
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -12,6 +21,139 @@ settings = get_settings()
 # Constants
 GROQ_DEFAULT_CONFIDENCE = 0.85  # High confidence for Llama 3.3 70B model
 GROQ_API_TIMEOUT = 10.0  # API timeout in seconds
+GROQ_MAX_RETRIES = 2  # Retries after the first attempt (429/5xx/transport errors)
+GROQ_BACKOFF_BASE = 0.5  # Seconds
+GROQ_BACKOFF_CAP = 5.0  # Longest wait before giving up (webhook replies are waiting)
+GROQ_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+GROQ_MAX_CONCURRENCY = 4  # Parallel requests in analyze_many (matches keepalive pool)
+GROQ_MAX_CONNECTIONS = 5  # HTTP pool size; also caps in-flight requests
+
+# In-process result cache (temperature=0 makes repeat inputs deterministic)
+GROQ_CACHE_MAXSIZE = 4096
+GROQ_CACHE_TTL = 3600.0  # 1 hour
+GROQ_CACHE_MAX_TEXT_LENGTH = 512  # Long inputs are rarely repeated; don't cache them
+
+
+# System prompts: static per analysis kind, so only the user message (the raw
+# text) varies between requests and the shared prefix can be cached server-side
+_EMOTION_SYSTEM_PROMPT = (
+    "Analyze the emotion in the user's message. Respond with ONLY one word from: "
+    "anger, joy, fear, sadness, love, surprise, neutral"
+)
+_SENTIMENT_SYSTEM_PROMPT = (
+    "Analyze the sentiment in the user's message. Respond with ONLY one word: "
+    "positive, negative, or neutral"
+)
+_ANALYSIS_SYSTEM_PROMPT = (
+    "Analyze the emotion and the sentiment in the user's message. Respond with ONLY two "
+    "words separated by a space: the emotion (one of: anger, joy, fear, sadness, love, "
+    "surprise, neutral) followed by the sentiment (one of: positive, negative, neutral)"
+)
+
+# Immutable scores shared by every result instead of rebuilt (via Decimal) per call
+_DEFAULT_SCORE = EmotionScore.from_float(GROQ_DEFAULT_CONFIDENCE)
+_FAILED_SCORE = EmotionScore.from_float(0.0)
+
+
+# Shared HTTP client (created on first use, recreated after close)
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Get the shared Groq HTTP client with connection pooling and HTTP/2.
+
+    Auth/content-type headers live on the client instead of every request.
+
+    Returns:
+        httpx.AsyncClient shared by all GroqAnalyzer instances
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {settings.groq_api_key}",
+                "Content-Type": "application/json",
+            },
+            timeout=httpx.Timeout(15.0, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=GROQ_MAX_CONNECTIONS,
+                max_keepalive_connections=3,
+                keepalive_expiry=30.0,
+            ),
+            http2=True,  # HTTP/2 multiplexing for better performance
+        )
+    return _client
+
+
+async def _close_client() -> None:
+    """Close the shared HTTP client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# In-flight request gate: never queue more requests than the pool has connections
+_request_slots = asyncio.Semaphore(GROQ_MAX_CONNECTIONS)
+
+# Set from x-ratelimit-* headers when Groq reports the request quota is used up
+_rate_limited_until = 0.0  # time.monotonic() deadline
+
+# Groq reset durations look like "7.66s", "2m59.56s" or "120ms"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def _parse_reset(value: str) -> float:
+    """Convert a Groq x-ratelimit-reset-* duration to seconds."""
+    return sum(float(n) * _DURATION_UNITS[unit] for n, unit in _DURATION_PART.findall(value))
+
+
+def _track_rate_limit(response: httpx.Response) -> None:
+    """
+    Remember when the request quota resets if Groq says none are left.
+
+    Args:
+        response: Any Groq API response
+    """
+    global _rate_limited_until
+    if response.headers.get("x-ratelimit-remaining-requests") == "0":
+        reset = _parse_reset(response.headers.get("x-ratelimit-reset-requests", ""))
+        _rate_limited_until = time.monotonic() + reset
+        logger.warning("Groq request quota exhausted", reset_seconds=round(reset, 2))
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """
+    Read the server-requested wait from a Retry-After header.
+
+    Args:
+        response: HTTP response (429/5xx)
+
+    Returns:
+        Seconds to wait, or None if the header is missing or not numeric
+    """
+    try:
+        return float(response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _cache_key(text: str) -> str:
+    """
+    Normalize text for cache lookups.
+
+    Case and whitespace differences ("Ciao!" vs " ciao! ") don't change the
+    label at temperature=0, so near-identical messages share one entry.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Casefolded text with whitespace runs collapsed
+    """
+    return " ".join(text.split()).casefold()
 
 
 class GroqAnalyzer:
@@ -30,22 +172,161 @@ class GroqAnalyzer:
         self.model_name = "llama-3.3-70b-versatile"
         self.model_type = ModelType.GROQ
 
-        # Create shared HTTP client with connection pooling and HTTP/2
-        self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(15.0, connect=5.0),
-            limits=httpx.Limits(
-                max_connections=5, max_keepalive_connections=3, keepalive_expiry=30.0
-            ),
-            http2=True,  # HTTP/2 multiplexing for better performance
-        )
+        # Request fields that never change; only "messages" is added per call.
+        # The answer is one line of one or two words: stop generating at the first
+        # newline instead of paying for an explanation up to max_tokens.
+        self._base_body: dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": 10,
+            "temperature": 0,
+            "stop": ["\n"],
+        }
+
+        # Repeat inputs (greetings, emoji-only messages) skip the API round-trip
+        self._cache = TTLCache(maxsize=GROQ_CACHE_MAXSIZE, ttl=GROQ_CACHE_TTL)
+
+        # In-flight requests by (kind, cache key): concurrent duplicates share one call
+        self._inflight: dict[tuple[str, str], asyncio.Future[Any]] = {}
 
         logger.info("Initialized Groq analyzer with connection pool", model=self.model)
 
     async def close(self) -> None:
-        """Close HTTP client gracefully."""
-        await self._client.aclose()
+        """Close the shared HTTP client gracefully."""
+        await _close_client()
         logger.info("Groq analyzer HTTP client closed")
 
+    def cache_clear(self) -> None:
+        """Drop all cached analysis results."""
+        self._cache.clear()
+
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Result cache counters (hits, misses, size)."""
+        return self._cache.stats()
+
+    async def _coalesce(
+        self, key: tuple[str, str], call: Callable[[str], Awaitable[Any]], text: str
+    ) -> Any:
+        """
+        Run call(text) once for all concurrent callers with the same key.
+
+        Groq's chat API takes one input per request, so identical messages
+        arriving together (retries, forwarded messages) are coalesced instead
+        of batched. The shared task is shielded so one caller being cancelled
+        does not cancel it for the others.
+
+        Args:
+            key: (analysis kind, text) identifying the request
+            call: Coroutine function performing the API call
+            text: Input text
+
+        Returns:
+            Result of call(text)
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call(text))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def _request_body(self, system_prompt: str, text: str) -> dict[str, Any]:
+        """Build a chat completion request: static system prompt + user text."""
+        return {
+            **self._base_body,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": text},
+            ],
+        }
+
+    async def _complete(self, system_prompt: str, text: str) -> str:
+        """
+        Run a chat completion and return the assistant's reply text.
+
+        Args:
+            system_prompt: Instructions for the analysis kind
+            text: User text, sent as-is as the user message
+
+        Returns:
+            Raw message content from the first choice
+
+        Raises:
+            httpx.HTTPError: If the request fails after retries
+        """
+        response = await self._post(orjson.dumps(self._request_body(system_prompt, text)))
+        return orjson.loads(response.content)["choices"][0]["message"]["content"]
+
+    async def _send(self, body: bytes) -> httpx.Response:
+        """
+        POST once, gated by the in-flight semaphore and the known rate-limit reset.
+
+        If the quota resets within GROQ_BACKOFF_CAP, wait for it instead of
+        spending a round-trip on a certain 429; longer waits are left to the
+        server (and _post's retry handling).
+
+        Args:
+            body: Encoded JSON request body
+
+        Returns:
+            HTTP response (any status)
+        """
+        async with _request_slots:
+            wait = _rate_limited_until - time.monotonic()
+            if 0 < wait <= GROQ_BACKOFF_CAP:
+                await asyncio.sleep(wait)
+            # Module-level client, looked up per request: all analyzer instances share
+            # one connection pool, and one that was closed is rebuilt on next use
+            response = await _get_client().post(self.api_url, content=body)
+        _track_rate_limit(response)
+        return response
+
+    async def _post(self, body: bytes) -> httpx.Response:
+        """
+        POST a chat completion, retrying rate limits and transient failures.
+
+        Waits follow decorrelated jitter (random between base and 3x the
+        previous wait, capped) so concurrent workers don't retry in lockstep.
+        A Retry-After header from Groq takes precedence; if it asks for more
+        than GROQ_BACKOFF_CAP the error is raised instead of waiting.
+
+        Args:
+            body: Encoded JSON request body
+
+        Returns:
+            Successful HTTP response
+
+        Raises:
+            httpx.HTTPError: If the request still fails after all retries
+        """
+        delay = GROQ_BACKOFF_BASE
+        for attempt in range(1, GROQ_MAX_RETRIES + 1):
+            try:
+                response = await self._send(body)
+            except httpx.TransportError as e:
+                wait, reason = None, type(e).__name__
+            else:
+                if response.status_code not in GROQ_RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response
+                wait, reason = _retry_after(response), f"HTTP {response.status_code}"
+                if wait is not None and wait > GROQ_BACKOFF_CAP:
+                    response.raise_for_status()
+
+            # Decorrelated jitter (not security-sensitive, plain random is fine)
+            jitter = random.uniform(GROQ_BACKOFF_BASE, delay * 3)  # noqa: S311
+            delay = min(GROQ_BACKOFF_CAP, jitter)
+            if wait is None:
+                wait = delay
+            logger.warning(
+                "Groq request failed, retrying", reason=reason, attempt=attempt, wait=wait
+            )
+            await asyncio.sleep(wait)
+
+        response = await self._send(body)
+        response.raise_for_status()
+        return response
+
     async def analyze_emotion(self, text: str) -> tuple[EmotionType, EmotionScore]:
         """
         Analyze text for emotion using Llama via Groq.
@@ -56,43 +337,30 @@ class GroqAnalyzer:
         Returns:
             Tuple of (EmotionType, EmotionScore)
         """
-        try:
-            prompt = f"""Analyze the emotion in this text. Respond with ONLY one word from: anger, joy, fear, sadness, love, surprise, neutral
-
-Text: {text}
-
-Emotion:"""
-
-            response = await self._client.post(
-                self.api_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "max_tokens": 10,
-                    "temperature": 0,
-                },
-            )
-            response.raise_for_status()
-            result = response.json()
+        key = _cache_key(text)
+        if (cached := self._cache.get(("emotion", key))) is not None:
+            return cached
+        return await self._coalesce(("emotion", key), self._query_emotion, text)
 
-            # Extract emotion label from response
-            label = result["choices"][0]["message"]["content"].strip().lower()
+    async def _query_emotion(self, text: str) -> tuple[EmotionType, EmotionScore]:
+        """Call Groq for the emotion label (caching successful results)."""
+        try:
+            # from_label normalizes case/whitespace
+            label = await self._complete(_EMOTION_SYSTEM_PROMPT, text)
 
             emotion = EmotionType.from_label(label)
-            score = EmotionScore.from_float(GROQ_DEFAULT_CONFIDENCE)
+            score = _DEFAULT_SCORE
 
             logger.debug(
                 "Groq emotion analysis", text=text[:50], emotion=emotion.value, score=str(score)
             )
+            if emotion is not EmotionType.UNKNOWN and len(text) <= GROQ_CACHE_MAX_TEXT_LENGTH:
+                self._cache.set(("emotion", _cache_key(text)), (emotion, score))
             return emotion, score
 
         except Exception as e:
             logger.error("Groq emotion analysis failed", error=str(e), text=text[:50])
-            return EmotionType.UNKNOWN, EmotionScore.from_float(0.0)
+            return EmotionType.UNKNOWN, _FAILED_SCORE
 
     async def analyze_sentiment(self, text: str) -> tuple[SentimentType, EmotionScore]:
         """
@@ -104,34 +372,19 @@ Emotion:"""
         Returns:
             Tuple of (SentimentType, EmotionScore)
         """
-        try:
-            prompt = f"""Analyze the sentiment in this text. Respond with ONLY one word: positive, negative, or neutral
-
-Text: {text}
-
-Sentiment:"""
-
-            response = await self._client.post(
-                self.api_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "max_tokens": 10,
-                    "temperature": 0,
-                },
-            )
-            response.raise_for_status()
-            result = response.json()
+        key = _cache_key(text)
+        if (cached := self._cache.get(("sentiment", key))) is not None:
+            return cached
+        return await self._coalesce(("sentiment", key), self._query_sentiment, text)
 
-            # Extract sentiment label from response
-            label = result["choices"][0]["message"]["content"].strip().lower()
+    async def _query_sentiment(self, text: str) -> tuple[SentimentType, EmotionScore]:
+        """Call Groq for the sentiment label (caching successful results)."""
+        try:
+            # from_label normalizes case/whitespace
+            label = await self._complete(_SENTIMENT_SYSTEM_PROMPT, text)
 
             sentiment = SentimentType.from_label(label)
-            score = EmotionScore.from_float(GROQ_DEFAULT_CONFIDENCE)
+            score = _DEFAULT_SCORE
 
             logger.debug(
                 "Groq sentiment analysis",
@@ -139,8 +392,86 @@ Sentiment:"""
                 sentiment=sentiment.value,
                 score=str(score),
             )
+            if sentiment is not SentimentType.UNKNOWN and len(text) <= GROQ_CACHE_MAX_TEXT_LENGTH:
+                self._cache.set(("sentiment", _cache_key(text)), (sentiment, score))
             return sentiment, score
 
         except Exception as e:
             logger.error("Groq sentiment analysis failed", error=str(e), text=text[:50])
-            return SentimentType.UNKNOWN, EmotionScore.from_float(0.0)
+            return SentimentType.UNKNOWN, _FAILED_SCORE
+
+    async def analyze(
+        self, text: str
+    ) -> tuple[tuple[EmotionType, EmotionScore], tuple[SentimentType, EmotionScore]]:
+        """
+        Analyze emotion and sentiment together in a single Groq request.
+
+        Halves API calls (and rate-limit usage) compared to calling
+        analyze_emotion and analyze_sentiment separately.
+
+        Args:
+            text: Input text (any language)
+
+        Returns:
+            Tuple of ((EmotionType, EmotionScore), (SentimentType, EmotionScore))
+        """
+        key = _cache_key(text)
+        emotion = self._cache.get(("emotion", key))
+        sentiment = self._cache.get(("sentiment", key))
+        if emotion is not None and sentiment is not None:
+            return emotion, sentiment
+        return await self._coalesce(("analysis", key), self._query_analysis, text)
+
+    async def _query_analysis(
+        self, text: str
+    ) -> tuple[tuple[EmotionType, EmotionScore], tuple[SentimentType, EmotionScore]]:
+        """Call Groq once for both labels (caching each successful result)."""
+        try:
+            # "<emotion> <sentiment>"
+            content = await self._complete(_ANALYSIS_SYSTEM_PROMPT, text)
+            labels = content.replace(",", " ").split()
+            emotion_type = EmotionType.from_label(labels[0]) if labels else EmotionType.UNKNOWN
+            sentiment_type = (
+                SentimentType.from_label(labels[1]) if len(labels) > 1 else SentimentType.UNKNOWN
+            )
+            score = _DEFAULT_SCORE
+
+            logger.debug(
+                "Groq combined analysis",
+                text=text[:50],
+                emotion=emotion_type.value,
+                sentiment=sentiment_type.value,
+            )
+            emotion, sentiment = (emotion_type, score), (sentiment_type, score)
+            if len(text) <= GROQ_CACHE_MAX_TEXT_LENGTH:
+                key = _cache_key(text)
+                if emotion_type is not EmotionType.UNKNOWN:
+                    self._cache.set(("emotion", key), emotion)
+                if sentiment_type is not SentimentType.UNKNOWN:
+                    self._cache.set(("sentiment", key), sentiment)
+            return emotion, sentiment
+
+        except Exception as e:
+            logger.error("Groq combined analysis failed", error=str(e), text=text[:50])
+            return (EmotionType.UNKNOWN, _FAILED_SCORE), (SentimentType.UNKNOWN, _FAILED_SCORE)
+
+    async def analyze_many(
+        self, texts: list[str], max_concurrency: int = GROQ_MAX_CONCURRENCY
+    ) -> list[tuple[tuple[EmotionType, EmotionScore], tuple[SentimentType, EmotionScore]]]:
+        """
+        Analyze several texts concurrently, at most max_concurrency requests at a time.
+
+        Args:
+            texts: Input texts
+            max_concurrency: Upper bound on in-flight Groq requests
+
+        Returns:
+            One analyze() result per text, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(text: str) -> Any:
+            async with semaphore:
+                return await self.analyze(text)
+
+        return await asyncio.gather(*(bounded(text) for text in texts))
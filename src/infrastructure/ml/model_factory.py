@@ -1,8 +1,12 @@
 """ML model factory for Groq analyzer."""
 
+import threading
+from typing import TYPE_CHECKING
+
 from config import get_logger, get_settings
 
-from .groq_analyzer import GroqAnalyzer
+if TYPE_CHECKING:
+    from .groq_analyzer import GroqAnalyzer
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -14,15 +18,22 @@ class ModelFactory:
     def __init__(self) -> None:
         """Initialize factory with empty cache."""
         self._groq: GroqAnalyzer | None = None
+        self._lock = threading.Lock()
 
-    def get_groq_analyzer(self) -> GroqAnalyzer:
+    def get_groq_analyzer(self) -> "GroqAnalyzer":
         """Get Groq analyzer (cached singleton)."""
         if not settings.groq_api_key:
             raise ValueError("GROQ_API_KEY not configured in environment")
 
+        # Double-checked locking: the steady-state path never takes the lock
         if self._groq is None:
-            logger.info("Creating Groq analyzer")
-            self._groq = GroqAnalyzer()
+            with self._lock:
+                if self._groq is None:
+                    # Imported on first use: httpx/HTTP2 stack stays out of cold start
+                    from .groq_analyzer import GroqAnalyzer
+
+                    logger.info("Creating Groq analyzer")
+                    self._groq = GroqAnalyzer()
         return self._groq
 
     async def cleanup(self) -> None:
@@ -35,12 +46,15 @@ class ModelFactory:
 
 # Global singleton
 _factory: ModelFactory | None = None
+_factory_lock = threading.Lock()
 
 
 def get_model_factory() -> ModelFactory:
-    """Get global model factory instance."""
+    """Get global model factory instance (created once, even under concurrent first calls)."""
     global _factory
     if _factory is None:
-        logger.info("Initializing model factory")
-        _factory = ModelFactory()
+        with _factory_lock:
+            if _factory is None:
+                logger.info("Initializing model factory")
+                _factory = ModelFactory()
     return _factory
@@ -1,11 +1,13 @@
 """API Key repository for database operations."""
 
+import hashlib
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 import bcrypt
-from sqlalchemy import Engine, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Engine, func, or_, select, update
+from sqlalchemy.orm import Session, sessionmaker
 
 from config import get_logger
 from infrastructure.database.models import APIKeyModel
@@ -13,6 +15,22 @@ from infrastructure.database.models import APIKeyModel
 logger = get_logger(__name__)
 
 
+def _key_prefix(api_key: str) -> str:
+    """
+    Compute the lookup digest stored in api_keys.key_prefix.
+
+    API keys are long random strings, so a truncated SHA-256 reveals nothing
+    useful; the bcrypt hash remains the actual credential check.
+
+    Args:
+        api_key: Plaintext API key
+
+    Returns:
+        First 16 hex chars of SHA-256(api_key)
+    """
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
 class APIKeyRepository:
     """
     Repository for API key database operations.
@@ -28,6 +46,10 @@ class APIKeyRepository:
             engine: SQLAlchemy engine
         """
         self.engine = engine
+        # Built once: every call on the auth hot path reuses the configured factory
+        self._session_factory: sessionmaker[Session] = sessionmaker(
+            bind=engine, autoflush=False, expire_on_commit=False
+        )
 
     def validate_key(self, api_key: str) -> tuple[bool, UUID | None, int | None]:
         """
@@ -39,33 +61,48 @@ class APIKeyRepository:
         Returns:
             Tuple of (is_valid, api_key_id, rate_limit_per_minute)
         """
-        with Session(self.engine) as session:
-            # Get all active API keys
-            stmt = select(APIKeyModel).where(APIKeyModel.is_active == True)  # noqa: E712
-            api_keys = session.scalars(stmt).all()
+        prefix = _key_prefix(api_key)
+
+        with self._session_factory.begin() as session:
+            # Only candidates with a matching lookup digest (normally one row), plus
+            # legacy keys without a digest yet; matching digests are tried first.
+            # Expiry is checked in SQL and only the columns needed here are fetched.
+            stmt = (
+                select(
+                    APIKeyModel.id,
+                    APIKeyModel.key_hash,
+                    APIKeyModel.key_prefix,
+                    APIKeyModel.rate_limit_per_minute,
+                    APIKeyModel.name,
+                )
+                .where(
+                    APIKeyModel.is_active == True,  # noqa: E712
+                    or_(APIKeyModel.key_prefix == prefix, APIKeyModel.key_prefix.is_(None)),
+                    or_(APIKeyModel.expires_at.is_(None), APIKeyModel.expires_at > func.now()),
+                )
+                .order_by(APIKeyModel.key_prefix.is_(None))
+            )
+            candidates = session.execute(stmt).all()
 
             # Check each key using constant-time bcrypt comparison
-            for key_model in api_keys:
+            for key_id, key_hash, key_prefix, rate_limit, key_name in candidates:
                 try:
-                    # Check expiration
-                    if key_model.expires_at and key_model.expires_at < datetime.now():
-                        logger.debug("API key expired", key_id=str(key_model.id))
-                        continue
-
                     # Verify using bcrypt (constant-time comparison)
-                    if bcrypt.checkpw(api_key.encode(), key_model.key_hash.encode()):
-                        # Update last_used_at timestamp
-                        key_model.last_used_at = datetime.now()
-                        session.commit()
-
-                        logger.info(
-                            "API key validated", key_id=str(key_model.id), key_name=key_model.name
+                    if bcrypt.checkpw(api_key.encode(), key_hash.encode()):
+                        # Update last_used_at timestamp (and backfill a legacy key's digest)
+                        values: dict[str, Any] = {"last_used_at": func.now()}
+                        if key_prefix is None:
+                            values["key_prefix"] = prefix
+                        session.execute(
+                            update(APIKeyModel).where(APIKeyModel.id == key_id).values(**values)
                         )
 
-                        return True, key_model.id, key_model.rate_limit_per_minute
+                        logger.info("API key validated", key_id=str(key_id), key_name=key_name)
+
+                        return True, key_id, rate_limit
 
                 except Exception as e:
-                    logger.error("Error validating API key", key_id=str(key_model.id), error=str(e))
+                    logger.error("Error validating API key", key_id=str(key_id), error=str(e))
                     continue
 
             logger.warning("Invalid API key attempt", key_prefix=api_key[:8])
@@ -90,13 +127,14 @@ class APIKeyRepository:
         Returns:
             Created APIKeyModel instance
         """
-        with Session(self.engine) as session:
+        with self._session_factory.begin() as session:
             # Hash the key with bcrypt (with salt)
             key_hash = bcrypt.hashpw(api_key.encode(), bcrypt.gensalt()).decode()
 
             # Create model
             model = APIKeyModel(
                 key_hash=key_hash,
+                key_prefix=_key_prefix(api_key),
                 name=name,
                 is_active=True,
                 rate_limit_per_minute=rate_limit_per_minute,
@@ -104,7 +142,7 @@ class APIKeyRepository:
             )
 
             session.add(model)
-            session.commit()
+            session.flush()
             session.refresh(model)
 
             logger.info(
@@ -126,18 +164,21 @@ class APIKeyRepository:
         Returns:
             True if deactivated, False if not found
         """
-        with Session(self.engine) as session:
-            stmt = select(APIKeyModel).where(APIKeyModel.id == key_id)
-            model = session.scalar(stmt)
+        with self._session_factory.begin() as session:
+            # Single UPDATE ... RETURNING: no SELECT and no entity load
+            stmt = (
+                update(APIKeyModel)
+                .where(APIKeyModel.id == key_id)
+                .values(is_active=False)
+                .returning(APIKeyModel.name)
+            )
+            key_name = session.execute(stmt).scalar_one_or_none()
 
-            if not model:
+            if key_name is None:
                 logger.warning("API key not found for deactivation", key_id=str(key_id))
                 return False
 
-            model.is_active = False
-            session.commit()
-
-            logger.info("API key deactivated", key_id=str(key_id), key_name=model.name)
+            logger.info("API key deactivated", key_id=str(key_id), key_name=key_name)
             return True
 
     def list_keys(self, include_inactive: bool = False) -> list[APIKeyModel]:
@@ -150,7 +191,7 @@ class APIKeyRepository:
         Returns:
             List of APIKeyModel instances
         """
-        with Session(self.engine) as session:
+        with self._session_factory.begin() as session:
             stmt = select(APIKeyModel)
 
             if not include_inactive:
@@ -1,19 +1,23 @@
 """Emotion repository implementation with SQLAlchemy."""
 
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import Select, and_, select
 from sqlalchemy.orm import Session
 
 from application.interfaces.emotion_repository import IEmotionRepository
 from config import get_logger
 from domain import EmotionRecord, EmotionScore, EmotionType, ModelType, SentimentType
 
-from ..database import EmotionModel, get_encryption
+from ..database import EmotionModel, UserModel, get_encryption
 
 logger = get_logger(__name__)
 
+# Rows per server-side cursor fetch when streaming long periods
+STREAM_CHUNK_SIZE = 200
+
 
 class EmotionRepository(IEmotionRepository):
     """
@@ -51,12 +55,13 @@ class EmotionRepository(IEmotionRepository):
             score=emotion.score.to_float(),
             model_type=emotion.model_type.value,
             sentiment=emotion.sentiment.value if emotion.sentiment else None,
-            created_at=emotion.created_at,
-            metadata=emotion.metadata,
+            # created_at is stamped by the server_default (NOW()) on insert
+            extra_data=emotion.metadata,
         )
 
+        # No flush: the id is assigned client-side, and the INSERT goes out with
+        # the request-scoped commit (batched with any other pending saves)
         self.session.add(db_emotion)
-        self.session.flush()  # Ensure ID is generated
 
         logger.info(
             "Emotion saved",
@@ -83,7 +88,7 @@ class EmotionRepository(IEmotionRepository):
         if db_emotion is None:
             return None
 
-        return self._to_domain(db_emotion)
+        return self._to_domain(db_emotion, self.encryption.decrypt(db_emotion.text_encrypted))
 
     def find_by_user(
         self,
@@ -111,7 +116,7 @@ class EmotionRepository(IEmotionRepository):
         )
 
         db_emotions = self.session.scalars(stmt).all()
-        return [self._to_domain(e) for e in db_emotions]
+        return self._to_domain_many(db_emotions)
 
     def find_by_user_and_period(
         self,
@@ -125,40 +130,134 @@ class EmotionRepository(IEmotionRepository):
         Args:
             user_id: User UUID
             start_date: Start of period
-            end_date: End of period
+            end_date: End of period (exclusive)
 
         Returns:
-            List of EmotionRecord
+            List of EmotionRecord, newest first
         """
-        stmt = (
+        # Bounded ranges (a month) are fetched in one go: a server-side cursor
+        # would only add DECLARE/FETCH round-trips before building the list anyway.
+        # Use iter_by_user_and_period when the caller can consume rows lazily.
+        db_emotions = self.session.scalars(self._period_query(user_id, start_date, end_date)).all()
+        return self._to_domain_many(db_emotions)
+
+    def iter_by_user_and_period(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Iterator[EmotionRecord]:
+        """
+        Stream emotions for user within date range.
+
+        Rows are fetched through a server-side cursor in chunks of
+        STREAM_CHUNK_SIZE and each chunk is decrypted in one batch, so memory
+        stays flat however long the range is. The session's connection is busy
+        until the iterator is exhausted or closed.
+
+        Args:
+            user_id: User UUID
+            start_date: Start of period
+            end_date: End of period (exclusive)
+
+        Yields:
+            EmotionRecord, newest first
+        """
+        stmt = self._period_query(user_id, start_date, end_date).execution_options(
+            yield_per=STREAM_CHUNK_SIZE
+        )
+
+        for chunk in self.session.scalars(stmt).partitions():
+            yield from self._to_domain_many(chunk)
+
+    @staticmethod
+    def _period_query(
+        user_id: UUID, start_date: datetime, end_date: datetime
+    ) -> Select[EmotionModel]:
+        """Select a user's emotions in [start_date, end_date), newest first."""
+        return (
             select(EmotionModel)
             .where(
                 and_(
                     EmotionModel.user_id == user_id,
                     EmotionModel.created_at >= start_date,
-                    EmotionModel.created_at <= end_date,
+                    EmotionModel.created_at < end_date,
                 )
             )
             .order_by(EmotionModel.created_at.desc())
         )
 
-        db_emotions = self.session.scalars(stmt).all()
-        return [self._to_domain(e) for e in db_emotions]
+    def find_report_rows(
+        self,
+        telegram_hash: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[UUID, str, str | None, float, str, datetime]]:
+        """
+        Find report rows for a user identified by hashed telegram ID.
+
+        Joins users in the same statement so reports need a single round-trip,
+        and selects only the columns a report shows: the encrypted text is
+        neither fetched nor decrypted.
+
+        Args:
+            telegram_hash: SHA-256 hash of the telegram ID
+            start_date: Optional start of period (inclusive)
+            end_date: Optional end of period (exclusive)
+            limit: Optional maximum results
+
+        Returns:
+            List of (id, emotion, sentiment, score, model_type, created_at) tuples,
+            newest first
+        """
+        stmt = (
+            select(
+                EmotionModel.id,
+                EmotionModel.emotion,
+                EmotionModel.sentiment,
+                EmotionModel.score,
+                EmotionModel.model_type,
+                EmotionModel.created_at,
+            )
+            .join(UserModel, UserModel.id == EmotionModel.user_id)
+            .where(UserModel.telegram_id_hash == telegram_hash)
+        )
+        if start_date is not None:
+            stmt = stmt.where(EmotionModel.created_at >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(EmotionModel.created_at < end_date)
+        stmt = stmt.order_by(EmotionModel.created_at.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return list(self.session.execute(stmt).tuples())
+
+    def _to_domain_many(self, db_emotions: Sequence[EmotionModel]) -> list[EmotionRecord]:
+        """
+        Convert database models to domain entities, decrypting texts in one batch.
+
+        Args:
+            db_emotions: EmotionModels from database
 
-    def _to_domain(self, db_emotion: EmotionModel) -> EmotionRecord:
+        Returns:
+            EmotionRecord domain entities, in input order
+        """
+        texts = self.encryption.decrypt_many([e.text_encrypted for e in db_emotions])
+        to_domain = self._to_domain
+        return [to_domain(e, text) for e, text in zip(db_emotions, texts, strict=True)]
+
+    def _to_domain(self, db_emotion: EmotionModel, decrypted_text: str) -> EmotionRecord:
         """
         Convert database model to domain entity.
 
         Args:
             db_emotion: EmotionModel from database
+            decrypted_text: Already decrypted text_encrypted value
 
         Returns:
             EmotionRecord domain entity
         """
-        # Decrypt text
-        decrypted_text = self.encryption.decrypt(db_emotion.text_encrypted)
-
-        # Convert to domain entity
         return EmotionRecord(
             id=db_emotion.id,
             user_id=db_emotion.user_id,
@@ -170,5 +269,5 @@ class EmotionRepository(IEmotionRepository):
             score=EmotionScore.from_float(db_emotion.score),
             model_type=ModelType(db_emotion.model_type),
             created_at=db_emotion.created_at,
-            metadata=db_emotion.metadata or {},
+            metadata=db_emotion.extra_data or {},
         )
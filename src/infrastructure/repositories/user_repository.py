@@ -2,14 +2,15 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from application.interfaces.user_repository import IUserRepository
 from config import get_logger
 from domain import User, UserId
 
-from ..database import UserModel
+from ..database import UserModel, enqueue_last_seen
 
 logger = get_logger(__name__)
 
@@ -36,16 +37,22 @@ class UserRepository(IUserRepository):
         Returns:
             Saved User
         """
-        db_user = UserModel(
+        # One INSERT ... ON CONFLICT instead of merge() (SELECT by PK, then INSERT/UPDATE)
+        insert_stmt = pg_insert(UserModel).values(
             id=user.id,
             telegram_id_hash=user.user_id.hashed_id,
             created_at=user.created_at,
             last_seen_at=user.last_seen_at,
             is_active=user.is_active,
         )
-
-        self.session.merge(db_user)  # Use merge for update or insert
-        self.session.flush()  # Flush to DB to make ID available for foreign keys
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[UserModel.id],
+            set_={
+                "last_seen_at": insert_stmt.excluded.last_seen_at,
+                "is_active": insert_stmt.excluded.is_active,
+            },
+        )
+        self.session.execute(stmt)
         logger.info("User saved", user_id=str(user.id), hash=user.user_id.hashed_id[:8])
         return user
 
@@ -83,17 +90,32 @@ class UserRepository(IUserRepository):
         existing = self.find_by_telegram_hash(user_id_vo.hashed_id)
 
         if existing:
-            # Update last seen
-            existing.update_last_seen()
-            self.save(existing)
+            # Update last seen (written behind, off the request path)
+            # (the returned timestamp, unlike the Optional field, is never None)
+            enqueue_last_seen(existing.id, existing.update_last_seen())
             logger.debug("Existing user found", user_id=str(existing.id))
             return existing
 
-        # Create new user
+        # Create new user in a single upsert: if a concurrent update inserted the
+        # same Telegram user first, the conflict resolves to that row instead of
+        # failing on the unique hash (or creating a duplicate)
         new_user = User.create(telegram_id)
-        self.save(new_user)
-        logger.info("New user created", user_id=str(new_user.id))
-        return new_user
+        insert_stmt = pg_insert(UserModel).values(
+            id=new_user.id,
+            telegram_id_hash=new_user.user_id.hashed_id,
+            created_at=new_user.created_at,
+            last_seen_at=new_user.last_seen_at,
+            is_active=new_user.is_active,
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[UserModel.telegram_id_hash],
+            set_={"last_seen_at": func.now()},
+        ).returning(UserModel)
+        db_user = self.session.scalars(stmt).one()
+
+        user = self._to_domain(db_user)
+        logger.info("New user created", user_id=str(user.id))
+        return user
 
     def _to_domain(self, db_user: UserModel) -> User:
         """Convert database model to domain entity."""
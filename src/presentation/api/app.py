@@ -1,21 +1,111 @@
 """FastAPI application factory."""
 
 import gc
+from collections.abc import Callable
 from contextlib import asynccontextmanager
+from functools import cache
 
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
+from starlette.middleware.base import BaseHTTPMiddleware
 
-from config import get_logger, get_settings, init_sentry, setup_logging
+from config import Settings, get_logger, get_settings, init_sentry, setup_logging
 
 logger = get_logger(__name__)
 settings = get_settings()
 
-# Global cache for analyzers
-_analyzer_cache = {}
+
+def _always(_: Settings) -> bool:
+    """Predicate for components every deployment gets."""
+    return True
+
+
+# Loaders import lazily (avoiding circular imports) and only for enabled entries
+def _load_request_size_limit() -> type[BaseHTTPMiddleware]:
+    """Import the request size limit middleware class."""
+    from .middleware.security import RequestSizeLimitMiddleware
+
+    return RequestSizeLimitMiddleware
+
+
+def _load_api_key() -> type[BaseHTTPMiddleware]:
+    """Import the API key middleware class."""
+    from .middleware.security import APIKeyMiddleware
+
+    return APIKeyMiddleware
+
+
+def _load_security_headers() -> type[BaseHTTPMiddleware]:
+    """Import the security headers middleware class."""
+    from .middleware.security import SecurityHeadersMiddleware
+
+    return SecurityHeadersMiddleware
+
+
+def _load_audit() -> type[BaseHTTPMiddleware]:
+    """Import the audit middleware class."""
+    from .middleware.audit import AuditMiddleware
+
+    return AuditMiddleware
+
+
+def _load_health() -> APIRouter:
+    """Import the health router."""
+    from .routes.health import router
+
+    return router
+
+
+def _load_emotion() -> APIRouter:
+    """Import the emotion router."""
+    from .routes.emotion import router
+
+    return router
+
+
+def _load_reports() -> APIRouter:
+    """Import the reports router."""
+    from .routes.reports import router
+
+    return router
+
+
+def _load_telegram_webhook() -> APIRouter:
+    """Import the telegram webhook router."""
+    from .routes.telegram_webhook import router
+
+    return router
+
+
+def _load_metrics() -> APIRouter:
+    """Import the metrics router."""
+    from .routes.metrics import router
+
+    return router
+
+
+# (enabled?, middleware loader) in add order: the last one added is the outermost.
+_MIDDLEWARES: tuple[
+    tuple[Callable[[Settings], bool], Callable[[], type[BaseHTTPMiddleware]]], ...
+] = (
+    # Security middlewares (CRITICAL - must be first)
+    (_always, _load_request_size_limit),  # First line of defense
+    (_always, _load_api_key),  # Blocks unauthorized access
+    (_always, _load_security_headers),  # Headers on all responses
+    (lambda s: s.is_production, _load_audit),
+)
+
+# (enabled?, router loader)
+_ROUTERS: tuple[tuple[Callable[[Settings], bool], Callable[[], APIRouter]], ...] = (
+    (_always, _load_health),
+    (_always, _load_emotion),
+    (_always, _load_reports),
+    (_always, _load_telegram_webhook),  # HappyKube 3.0
+    (lambda s: s.prometheus_enabled, _load_metrics),
+)
 
 
 @asynccontextmanager
@@ -35,6 +125,14 @@ async def lifespan(app: FastAPI):
         version=settings.app_version,
     )
 
+    # Create upcoming monthly emotions/audit_log partitions now and periodically after,
+    # and start the audit/last-seen write-behind flusher on the server's event loop
+    # (close_database() stops both, draining the flusher)
+    from infrastructure.database import start_partition_maintenance, start_write_flusher
+
+    start_partition_maintenance()
+    start_write_flusher()
+
     # Pre-warm critical connections (lazy load models)
     logger.info("Resources initialized (models will load on-demand)")
 
@@ -53,6 +151,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error("Error closing Groq analyzer", error=str(e))
 
+    # Close bot command handlers' internal API client and the shared Telegram Bot
+    try:
+        from presentation.api.routes.telegram_webhook import close_bot, command_handlers
+
+        await command_handlers.close()
+        await close_bot()
+    except Exception as e:
+        logger.error("Error closing bot API client", error=str(e))
+
     # Close Redis connection (sync operation)
     try:
         from infrastructure.cache import get_cache
@@ -66,20 +173,26 @@ async def lifespan(app: FastAPI):
     try:
         from infrastructure.database import close_database
 
-        close_database()
+        await close_database()
         logger.info("Database connections closed")
     except Exception as e:
         logger.error("Error closing database", error=str(e))
 
-    # Clear analyzer cache
-    _analyzer_cache.clear()
-
     # Force garbage collection
     gc.collect()
 
     logger.info("Cleanup completed")
 
 
+@cache
+def _bootstrap() -> None:
+    """Configure logging and Sentry once per process (create_app may run many times)."""
+    setup_logging(service_name="api")
+
+    # Initialize Sentry for error tracking (production only)
+    init_sentry()
+
+
 def create_app() -> FastAPI:
     """
     Create and configure FastAPI application.
@@ -87,10 +200,7 @@ def create_app() -> FastAPI:
     Returns:
         Configured FastAPI app
     """
-    setup_logging(service_name="api")
-
-    # Initialize Sentry for error tracking (production only)
-    init_sentry()
+    _bootstrap()
 
     app = FastAPI(
         title=settings.app_name,
@@ -110,63 +220,30 @@ def create_app() -> FastAPI:
             allow_methods=["GET", "POST", "OPTIONS"],
             allow_headers=["Content-Type", "X-API-Key", "Authorization"],
         )
-        logger.info("CORS enabled", origins=settings.cors_origins)
 
     # Configure rate limiting
     limiter = Limiter(key_func=get_remote_address)
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-    # Add security middlewares (CRITICAL - must be first)
-    from .middleware.security import (
-        APIKeyMiddleware,
-        RequestSizeLimitMiddleware,
-        SecurityHeadersMiddleware,
-    )
-
-    # Request size limit (first line of defense)
-    app.add_middleware(RequestSizeLimitMiddleware)
-    logger.info("Request size limit enabled", max_size="1MB")
-
-    # API Key authentication (blocks unauthorized access)
-    app.add_middleware(APIKeyMiddleware)
-    logger.info("API Key authentication enabled")
-
-    # Security headers (add to all responses)
-    app.add_middleware(SecurityHeadersMiddleware)
-    logger.info("Security headers enabled")
-
-    # Add audit middleware (if enabled)
-    if settings.is_production:
-        from .middleware.audit import AuditMiddleware
-
-        app.add_middleware(AuditMiddleware)
-        logger.info("Audit logging enabled")
-
-    # Include routers (lazy import to avoid circular dependencies)
-    from .routes import emotion, health, reports, telegram_webhook
-
-    app.include_router(health.router)
-    app.include_router(emotion.router)
-    app.include_router(reports.router)
-    logger.info("Monthly reports API enabled", endpoint="/reports")
-
-    # Telegram Webhook (HappyKube 3.0)
-    app.include_router(telegram_webhook.router)
-    logger.info("Telegram webhook enabled", endpoint="/telegram/webhook")
-
-    # Add Prometheus metrics endpoint (if enabled)
-    if settings.prometheus_enabled:
-        from .routes import metrics
+    # Middlewares and routers enabled for this deployment
+    middlewares = [load() for enabled, load in _MIDDLEWARES if enabled(settings)]
+    for middleware in middlewares:
+        app.add_middleware(middleware)
 
-        app.include_router(metrics.router)
-        logger.info("Prometheus metrics enabled", endpoint="/metrics")
+    router_loaders = [load for enabled, load in _ROUTERS if enabled(settings)]
+    for load in router_loaders:
+        app.include_router(load())
 
+    # One startup record instead of one per feature
     logger.info(
         "FastAPI app created with lifespan management",
         env=settings.app_env,
         debug=settings.debug,
         version=settings.app_version,
+        cors_origins=settings.cors_origins if settings.cors_enabled else None,
+        middlewares=[middleware.__name__ for middleware in middlewares],
+        routers=[load.__name__.removeprefix("_load_") for load in router_loaders],
     )
 
     return app
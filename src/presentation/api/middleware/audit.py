@@ -1,29 +1,42 @@
 """Audit logging middleware."""
 
+import re
 from datetime import UTC, datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from fastapi import Request
+from starlette.background import BackgroundTask, BackgroundTasks
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.responses import Response
 
-from config import get_logger
-from infrastructure.auth import JWTUtils
-from infrastructure.database import get_db_session
-from infrastructure.database.models import AuditLogModel
+from config import get_logger, get_settings
+from infrastructure.database import enqueue_audit
 
 logger = get_logger(__name__)
+settings = get_settings()
+
+# Reads (including reports of users' emotion history) are audited unless
+# AUDIT_READ_REQUESTS=false opts out of recording them
+_UNAUDITED_METHODS: frozenset[str] = (
+    frozenset() if settings.audit_read_requests else frozenset({"GET", "HEAD", "OPTIONS"})
+)
+
+# Root, health checks/probes, metrics and API docs (and anything below them)
+# are not audited
+_EXCLUDED_PATHS = re.compile(
+    r"/(?:(?:healthz|ping|readyz|metrics|docs|redoc|openapi\.json)(?:/.*)?)?"
+)
 
 
 class AuditMiddleware(BaseHTTPMiddleware):
     """
     Middleware for audit logging.
 
-    Logs all API requests for security and compliance.
+    Logs all API requests except health checks, metrics and docs for
+    security and compliance (reads can be opted out with
+    AUDIT_READ_REQUESTS=false).
     """
 
-    EXCLUDED_PATHS = {"/healthz", "/ping", "/readyz", "/metrics", "/"}
-
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         """
         Process request and log to audit table.
@@ -35,41 +48,52 @@ class AuditMiddleware(BaseHTTPMiddleware):
         Returns:
             HTTP response
         """
-        # Skip audit logging for health checks
-        if request.url.path in self.EXCLUDED_PATHS:
+        # Skip health checks (and opted-out reads) using the raw ASGI scope: no URL object built
+        if request.scope["method"] in _UNAUDITED_METHODS or _EXCLUDED_PATHS.fullmatch(
+            request.scope["path"]
+        ):
             return await call_next(request)
 
-        # Extract request details
-        user_id = self._extract_user_id(request)
-        action = f"{request.method} {request.url.path}"
-        ip_address = request.client.host if request.client else None
-        user_agent = request.headers.get("user-agent")
-
         # Process request
         response = await call_next(request)
 
-        # Log to database (don't block response)
+        # Record after the response has been sent: JWT parsing and queueing
+        # never delay the client
+        audit = BackgroundTask(self._record, request)
+        if response.background is None:
+            response.background = audit
+        else:
+            response.background = BackgroundTasks([response.background, audit])
+
+        return response
+
+    async def _record(self, request: Request) -> None:
+        """
+        Queue the audit row for a handled request.
+
+        Async on purpose: Starlette runs sync background tasks in a worker
+        thread, where there is no event loop to queue onto.
+
+        Args:
+            request: Handled HTTP request
+        """
+        path = request.scope["path"]
+        action = f"{request.method} {path}"
+
+        # Queue for the background writer
         try:
-            # Use context manager properly
-            with get_db_session() as db:
-                audit_entry = AuditLogModel(
-                    id=uuid4(),
-                    user_id=user_id,
-                    action=action,
-                    endpoint=request.url.path,
-                    ip_address=ip_address,
-                    user_agent=user_agent,
-                    created_at=datetime.now(UTC),
-                )
-                db.add(audit_entry)
-                db.commit()
-                logger.debug("Audit log created", action=action, ip=ip_address)
+            enqueue_audit(
+                user_id=self._extract_user_id(request),
+                action=action,
+                endpoint=path,
+                ip_address=request.client.host if request.client else None,
+                user_agent=request.headers.get("user-agent"),
+                created_at=datetime.now(UTC),
+            )
         except Exception as e:
             logger.error("Failed to create audit log", error=str(e), action=action)
             # Don't fail the request if audit logging fails
 
-        return response
-
     @staticmethod
     def _extract_user_id(request: Request) -> UUID | None:
         """
@@ -85,18 +109,22 @@ class AuditMiddleware(BaseHTTPMiddleware):
         Returns:
             User UUID or None if not authenticated
         """
-        # Try request state first (set by auth middleware)
-        if hasattr(request.state, "user_id"):
-            return request.state.user_id
+        # Try request state first (set by auth middleware): no token to verify
+        user_id = getattr(request.state, "user_id", None)
+        if user_id is not None:
+            return user_id
 
         # Try Authorization header (JWT token)
         auth_header = request.headers.get("authorization")
         if auth_header:
+            # Imported on first token: PyJWT stays out of startup when unused
+            from infrastructure.auth import JWTUtils
+
             user_id = JWTUtils.extract_from_request_header(auth_header)
             if user_id:
                 logger.debug("User ID extracted from JWT", user_id=str(user_id))
                 return user_id
 
         # No authentication found
-        logger.debug("No user authentication found", path=request.url.path)
+        logger.debug("No user authentication found", path=request.scope["path"])
         return None
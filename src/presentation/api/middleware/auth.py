@@ -1,5 +1,7 @@
 """API authentication middleware."""
 
+import hashlib
+
 from fastapi import Header, HTTPException, status
 
 from config import get_logger, get_settings
@@ -7,6 +9,12 @@ from config import get_logger, get_settings
 logger = get_logger(__name__)
 settings = get_settings()
 
+# SHA-256 digests of the configured keys: one hash + set lookup per request,
+# independent of how many keys are configured and of where a mismatch occurs
+_API_KEY_DIGESTS = frozenset(
+    hashlib.sha256(key.encode()).digest() for key in settings.api_keys or ()
+)
+
 
 async def require_api_key(x_api_key: str | None = Header(None)) -> None:
     """
@@ -29,7 +37,7 @@ async def require_api_key(x_api_key: str | None = Header(None)) -> None:
         )
 
     # Validate API key
-    if not settings.api_keys or x_api_key not in settings.api_keys:
+    if hashlib.sha256(x_api_key.encode()).digest() not in _API_KEY_DIGESTS:
         logger.warning(
             "Invalid API key",
             key_prefix=x_api_key[:8] if x_api_key else "None",
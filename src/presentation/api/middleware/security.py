@@ -1,16 +1,32 @@
 """Security middleware for API protection."""
 
+import asyncio
+import hashlib
+import hmac
+import secrets
+
 from fastapi import Request, status
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.responses import JSONResponse, Response
 
 from config import get_logger, get_settings
+from infrastructure.cache.memory_cache import TTLCache
 from infrastructure.database import get_engine
 from infrastructure.repositories import APIKeyRepository
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Successful bcrypt verifications are remembered briefly, so repeat requests with
+# the same key skip bcrypt and the database. Revoked/expired keys stop working
+# within API_KEY_CACHE_TTL.
+API_KEY_CACHE_MAXSIZE = 4096
+API_KEY_CACHE_TTL = 60.0  # seconds
+
+# Cache keys are HMACs of the API key under a per-process secret, so raw keys
+# never sit in memory as dict keys
+_API_KEY_CACHE_SECRET = secrets.token_bytes(32)
+
 
 class APIKeyMiddleware(BaseHTTPMiddleware):
     """
@@ -23,27 +39,31 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
     - Bcrypt-hashed keys (no plaintext storage)
     - Expiration checking
     - Rate limit per key
-    - Last used timestamp tracking
+    - Last used timestamp tracking (refreshed on each cache miss)
+    - Short-lived in-process cache of successful verifications
     """
 
     # Endpoints that don't require authentication
-    PUBLIC_PATHS = {
-        "/",
-        "/healthz",
-        "/ping",
-        "/readyz",
-        "/metrics",
-        "/docs",
-        "/redoc",
-        "/openapi.json",
-        "/telegram/webhook",  # Telegram webhook (uses secret token, not API key)
-    }
+    PUBLIC_PATHS = frozenset(
+        {
+            "/",
+            "/healthz",
+            "/ping",
+            "/readyz",
+            "/metrics",
+            "/docs",
+            "/redoc",
+            "/openapi.json",
+            "/telegram/webhook",  # Telegram webhook (uses secret token, not API key)
+        }
+    )
 
     def __init__(self, app):
         """Initialize middleware with database connection."""
         super().__init__(app)
         self._engine = None
         self._api_key_repo = None
+        self._valid_keys = TTLCache(maxsize=API_KEY_CACHE_MAXSIZE, ttl=API_KEY_CACHE_TTL)
 
     def _get_repository(self) -> APIKeyRepository:
         """Lazy-load API key repository."""
@@ -63,8 +83,9 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
         Returns:
             HTTP response or 403 Forbidden
         """
-        # Skip auth for public endpoints
-        if request.url.path in self.PUBLIC_PATHS:
+        # Skip auth for public endpoints (raw scope path: no URL object is built)
+        path = request.scope["path"]
+        if path in self.PUBLIC_PATHS:
             return await call_next(request)
 
         # Extract API key from header
@@ -73,7 +94,7 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
         if not api_key:
             logger.warning(
                 "Unauthorized request - missing API key",
-                path=request.url.path,
+                path=path,
                 ip=request.client.host if request.client else None,
             )
             return JSONResponse(
@@ -84,15 +105,22 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
                 },
             )
 
+        digest = hmac.new(_API_KEY_CACHE_SECRET, api_key.encode(), hashlib.sha256).digest()
+        cached = self._valid_keys.get(digest)
+        if cached is not None:
+            request.state.api_key_id, request.state.rate_limit = cached
+            return await call_next(request)
+
         # Validate API key against database (with bcrypt verification)
         try:
             repo = self._get_repository()
-            is_valid, api_key_id, rate_limit = repo.validate_key(api_key)
+            # bcrypt releases the GIL, so run it in a worker thread instead of the event loop
+            is_valid, api_key_id, rate_limit = await asyncio.to_thread(repo.validate_key, api_key)
 
             if not is_valid:
                 logger.warning(
                     "Unauthorized request - invalid API key",
-                    path=request.url.path,
+                    path=path,
                     ip=request.client.host if request.client else None,
                     key_prefix=api_key[:8] if len(api_key) >= 8 else "***",
                 )
@@ -104,11 +132,10 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
             # Store API key ID in request state for audit logging
             request.state.api_key_id = api_key_id
             request.state.rate_limit = rate_limit
+            self._valid_keys.set(digest, (api_key_id, rate_limit))
 
         except Exception as e:
-            logger.error(
-                "Error validating API key", path=request.url.path, error=str(e), exc_info=e
-            )
+            logger.error("Error validating API key", path=path, error=str(e), exc_info=e)
             return JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={"detail": "Authentication service error", "error": "internal_error"},
@@ -194,7 +221,7 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
                     "Request too large",
                     size=content_length,
                     max_size=self.MAX_REQUEST_SIZE,
-                    path=request.url.path,
+                    path=request.scope["path"],
                     ip=request.client.host if request.client else None,
                 )
                 return JSONResponse(
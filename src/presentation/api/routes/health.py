@@ -83,7 +83,7 @@ async def healthz():
 async def healthz_db(response: Response):
     """Database health check."""
     try:
-        if db_health_check():
+        if await db_health_check():
             return {"status": "healthy", "service": "database"}
         else:
             response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
@@ -179,20 +179,18 @@ async def readyz(response: Response):
     """
     try:
         # Check database
-        db_healthy = db_health_check()
+        db_healthy = await db_health_check()
 
         # Check Redis
         cache = get_cache()
         redis_healthy = cache.health_check()
 
-        # Check Groq API via existing analyzer client (reuses connection pool)
+        # Check Groq API via the analyzers' shared client (reuses connection pool)
         groq_healthy = False
         try:
-            from infrastructure.ml.model_factory import get_model_factory
+            from infrastructure.ml.groq_analyzer import _get_client
 
-            factory = get_model_factory()
-            analyzer = factory.get_groq_analyzer()
-            groq_response = await analyzer._client.get(
+            groq_response = await _get_client().get(
                 "https://api.groq.com/openai/v1/models",
                 headers={"Authorization": f"Bearer {settings.groq_api_key}"},
             )
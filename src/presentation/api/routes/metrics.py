@@ -52,6 +52,7 @@ telegram_messages_total = Counter(
     - `happykube_active_users` - Active users in 7-day window
     - `happykube_api_requests_total` - API request counts (by method, endpoint, status)
     - `happykube_telegram_messages_total` - Telegram messages processed (by command)
+    - `happykube_write_queue_dropped_total` - Write-behind rows dropped on overload (by kind)
 
     **Note:** Only available if `PROMETHEUS_ENABLED=true` in environment.
     """,
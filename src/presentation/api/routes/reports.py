@@ -10,7 +10,7 @@ from application.services.emotion_service import EmotionService
 from config import get_logger
 from infrastructure.cache import get_cache
 from infrastructure.database import get_db
-from infrastructure.ml import ModelFactory
+from infrastructure.ml import get_model_factory
 from infrastructure.repositories import EmotionRepository, UserRepository
 
 logger = get_logger(__name__)
@@ -24,7 +24,7 @@ limiter = Limiter(key_func=get_remote_address)
 def _get_emotion_service(db: Session) -> EmotionService:
     """Create EmotionService instance with dependencies."""
     cache = get_cache()
-    model_factory = ModelFactory()
+    model_factory = get_model_factory()
 
     emotion_repo = EmotionRepository(db)
     user_repo = UserRepository(db)
@@ -9,10 +9,13 @@ SECURITY FEATURES:
 - HTTPS required (Fly.io provides TLS)
 """
 
+import logging
+
 from fastapi import APIRouter, Header, HTTPException, Request, status
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from telegram import Bot, Update
+from telegram.request import HTTPXRequest
 
 from config import get_logger, get_settings
 from presentation.bot.handlers import CommandHandlers, MessageHandlers
@@ -38,6 +41,35 @@ messages = {
 command_handlers = CommandHandlers(messages)
 message_handlers = MessageHandlers(messages)
 
+# Shared Bot: keeps one pooled HTTP client to the Telegram API for all updates
+_bot: Bot | None = None
+# The Bot's own request objects. It is never initialize()d (that would call
+# getMe), so Bot.shutdown() is a no-op and these are closed directly.
+_bot_requests: tuple[HTTPXRequest, HTTPXRequest] | None = None
+
+
+def _get_bot() -> Bot:
+    """Get the shared Bot instance (created on first use)."""
+    global _bot, _bot_requests
+    if _bot is None:
+        _bot_requests = (HTTPXRequest(), HTTPXRequest())
+        _bot = Bot(
+            token=settings.telegram_bot_token,
+            request=_bot_requests[0],
+            get_updates_request=_bot_requests[1],
+        )
+    return _bot
+
+
+async def close_bot() -> None:
+    """Close the shared Bot's HTTP clients. Call on application shutdown."""
+    global _bot, _bot_requests
+    if _bot_requests is not None:
+        for request in _bot_requests:
+            await request.shutdown()
+    _bot = None
+    _bot_requests = None
+
 
 @router.post(
     "/webhook",
@@ -122,7 +154,7 @@ async def telegram_webhook(
     elif "edited_message" in update_data:
         # Optionally handle edited messages
         logger.debug("Ignoring edited message", update_id=update_id)
-    else:
+    elif logging.getLogger(__name__).isEnabledFor(logging.DEBUG):
         logger.debug("Unsupported update type", update_id=update_id, keys=list(update_data.keys()))
 
     return {"status": "ok"}
@@ -136,11 +168,8 @@ async def _process_message(message: dict) -> None:
         message: Telegram Message object
     """
     try:
-        # Create Telegram Update and Message objects
-        bot = Bot(token=settings.telegram_bot_token)
-
         # Build Update object from webhook data
-        update = Update.de_json({"update_id": 0, "message": message}, bot)
+        update = Update.de_json({"update_id": 0, "message": message}, _get_bot())
 
         if not update or not update.message:
             logger.error("Failed to parse Telegram message", message=message)
@@ -159,7 +188,7 @@ async def _process_message(message: dict) -> None:
 
         # Check if message is a command
         if text and text.startswith("/"):
-            command = text.split()[0].lower()
+            command = text.split(maxsplit=1)[0].lower()  # Only the first word is needed
             await _handle_command(update, command)
         elif text:
             await _handle_text(update)
@@ -172,34 +201,31 @@ async def _process_message(message: dict) -> None:
         # Telegram will retry failed webhooks, causing duplicates
 
 
+class _EmptyContext:
+    """Placeholder for the handler context argument (not used in webhook mode)."""
+
+
+_context = _EmptyContext()
+
+# Command -> handler, resolved with one dict lookup per message
+_COMMANDS = {
+    "/start": command_handlers.start,
+    "/help": command_handlers.help,
+    "/ask": command_handlers.ask,
+    "/monthly": command_handlers.monthly,
+    "/exit": command_handlers.exit,
+}
+
+
 async def _handle_command(update: Update, command: str) -> None:
     """Route command to appropriate handler."""
-
-    # Create empty context (not used in webhook mode)
-    class EmptyContext:
-        pass
-
-    context = EmptyContext()
-
-    if command == "/start":
-        await command_handlers.start(update, context)
-    elif command == "/help":
-        await command_handlers.help(update, context)
-    elif command == "/ask":
-        await command_handlers.ask(update, context)
-    elif command == "/monthly":
-        await command_handlers.monthly(update, context)
-    elif command == "/exit":
-        await command_handlers.exit(update, context)
-    else:
+    handler = _COMMANDS.get(command)
+    if handler is None:
         logger.debug("Unknown command", command=command)
+        return
+    await handler(update, _context)
 
 
 async def _handle_text(update: Update) -> None:
     """Route text message to handler."""
-
-    class EmptyContext:
-        pass
-
-    context = EmptyContext()
-    await message_handlers.handle_text(update, context)
+    await message_handlers.handle_text(update, _context)
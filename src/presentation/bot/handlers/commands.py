@@ -1,5 +1,6 @@
 """Telegram bot command handlers."""
 
+import heapq
 from datetime import datetime
 
 import httpx
@@ -23,6 +24,36 @@ class CommandHandlers:
             messages: Dictionary of localized messages
         """
         self.messages = messages
+        # Internal API client, created on first use and reused (keep-alive)
+        self._api_client: httpx.AsyncClient | None = None
+
+    def _get_api_client(self) -> httpx.AsyncClient:
+        """
+        Get or create the shared client for internal API calls.
+
+        Returns:
+            httpx.AsyncClient bound to the local API with auth headers preset
+        """
+        if self._api_client is None:
+            # Add API key header for authentication
+            headers = {}
+            if settings.internal_api_key:
+                headers["X-API-Key"] = settings.internal_api_key
+
+            self._api_client = httpx.AsyncClient(
+                base_url=f"http://localhost:{settings.api_port}",
+                headers=headers,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=5, max_keepalive_connections=2),
+            )
+        return self._api_client
+
+    async def close(self) -> None:
+        """Close the internal API client gracefully."""
+        if self._api_client is not None:
+            await self._api_client.aclose()
+            self._api_client = None
+            logger.info("Bot command API client closed")
 
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """
@@ -148,16 +179,10 @@ I tuoi messaggi sono criptati e sicuri.
         await update.message.reply_text("📊 Recupero le tue statistiche mensili...")
 
         try:
-            # Call internal API endpoint with authentication
-            api_url = f"http://localhost:{settings.api_port}/reports/monthly/{telegram_id}/{current_month}"
-
-            # Add API key header for authentication
-            headers = {}
-            if settings.internal_api_key:
-                headers["X-API-Key"] = settings.internal_api_key
-
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(api_url, headers=headers)
+            # Call internal API endpoint (auth header preset on the shared client)
+            response = await self._get_api_client().get(
+                f"/reports/monthly/{telegram_id}/{current_month}"
+            )
 
             if response.status_code == 404:
                 month_name = self._get_month_name(current_month)
@@ -182,10 +207,8 @@ I tuoi messaggi sono criptati e sicuri.
             msg += f"📝 Messaggi totali: {data['total_messages']}\n"
             msg += f"📅 Giorni attivi: {data['active_days']}\n\n"
 
-            # Top 3 emotions
-            emotions = sorted(data["emotions"].items(), key=lambda x: x[1]["count"], reverse=True)[
-                :3
-            ]
+            # Top 3 emotions (partial selection, no full sort)
+            emotions = heapq.nlargest(3, data["emotions"].items(), key=lambda x: x[1]["count"])
 
             msg += "*🎭 Top 3 Emozioni:*\n"
             for emotion_name, stats in emotions:
@@ -12,6 +12,18 @@ from infrastructure.repositories import EmotionRepository, UserRepository
 
 logger = get_logger(__name__)
 
+# Reply decorations, built once at import instead of per handled message
+_EMOTION_EMOJI: dict[str, str] = {
+    "joy": "😊",
+    "sadness": "😢",
+    "anger": "😠",
+    "fear": "😨",
+    "surprise": "😲",
+    "disgust": "🤢",
+    "neutral": "😐",
+}
+_SENTIMENT_EMOJI: dict[str, str] = {"positive": "👍", "negative": "👎", "neutral": "🤷"}
+
 
 class MessageHandlers:
     """Handlers for Telegram bot messages."""
@@ -77,15 +89,7 @@ class MessageHandlers:
             await update.message.delete()
 
             # Prepare response with emoji
-            emotion_emoji = {
-                "joy": "😊",
-                "sadness": "😢",
-                "anger": "😠",
-                "fear": "😨",
-                "surprise": "😲",
-                "disgust": "🤢",
-                "neutral": "😐",
-            }.get(result.emotion, "🤔")
+            emotion_emoji = _EMOTION_EMOJI.get(result.emotion, "🤔")
 
             response = (
                 f"{self.messages.get('thanks', 'Grazie per aver condiviso!')}\n\n"
@@ -95,9 +99,7 @@ class MessageHandlers:
             )
 
             if result.sentiment:
-                sentiment_emoji = {"positive": "👍", "negative": "👎", "neutral": "🤷"}.get(
-                    result.sentiment, "❓"
-                )
+                sentiment_emoji = _SENTIMENT_EMOJI.get(result.sentiment, "❓")
                 response += f"\n{sentiment_emoji} *Sentiment:* {result.sentiment}"
 
             await update.message.reply_text(response, parse_mode="Markdown")
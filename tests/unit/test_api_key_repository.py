@@ -141,6 +141,20 @@ class TestAPIKeyRepository:
             updated = session.get(APIKeyModel, created.id)
             assert updated.last_used_at is not None
 
+    def test_validate_legacy_key_backfills_prefix(self, api_key_repo, sample_api_key, in_memory_db):
+        """Test that a key created without a lookup prefix still validates and gets one."""
+        created = api_key_repo.create_key(api_key=sample_api_key, name="Legacy Key")
+        with Session(in_memory_db) as session:
+            session.get(APIKeyModel, created.id).key_prefix = None
+            session.commit()
+
+        is_valid, key_id, _ = api_key_repo.validate_key(sample_api_key)
+
+        assert is_valid is True
+        assert key_id == created.id
+        with Session(in_memory_db) as session:
+            assert session.get(APIKeyModel, created.id).key_prefix == created.key_prefix
+
     def test_deactivate_key(self, api_key_repo, sample_api_key):
         """Test deactivating an API key."""
         # Create key
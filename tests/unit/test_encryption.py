@@ -0,0 +1,71 @@
+"""Unit tests for FieldEncryption."""
+
+import pytest
+from cryptography.fernet import Fernet
+
+from infrastructure.database.encryption import FieldEncryption
+
+
+@pytest.fixture
+def fernet_key():
+    """Valid Fernet key (the format stored in ENCRYPTION_KEY)."""
+    return Fernet.generate_key().decode()
+
+
+@pytest.fixture
+def encryption(fernet_key):
+    """FieldEncryption bound to the test key."""
+    return FieldEncryption(fernet_key)
+
+
+class TestFieldEncryption:
+    """Test suite for FieldEncryption."""
+
+    def test_round_trip(self, encryption):
+        """Test that encrypted text decrypts to the original."""
+        ciphertext = encryption.encrypt("Oggi mi sento felice! 😊")
+
+        assert isinstance(ciphertext, bytes)
+        assert encryption.decrypt(ciphertext) == "Oggi mi sento felice! 😊"
+
+    def test_encrypts_bytes_input(self, encryption):
+        """Test that bytes are encrypted directly, not passed through."""
+        ciphertext = encryption.encrypt("già".encode())
+
+        assert ciphertext != "già".encode()
+        assert encryption.decrypt(ciphertext) == "già"
+
+    def test_nonce_is_random(self, encryption):
+        """Test that the same plaintext encrypts differently each time."""
+        assert encryption.encrypt("ciao") != encryption.encrypt("ciao")
+
+    def test_empty_values(self, encryption):
+        """Test empty input short-circuits."""
+        assert encryption.encrypt("") == b""
+        assert encryption.decrypt(b"") == ""
+
+    def test_decrypts_legacy_fernet_token(self, encryption, fernet_key):
+        """Test that rows written with Fernet are still readable."""
+        legacy = Fernet(fernet_key.encode()).encrypt(b"testo storico")
+
+        assert encryption.decrypt(legacy) == "testo storico"
+
+    def test_decrypt_many(self, encryption, fernet_key):
+        """Test batch decryption keeps order and handles empty/legacy values."""
+        legacy = Fernet(fernet_key.encode()).encrypt(b"testo storico")
+        ciphertexts = [encryption.encrypt("uno"), b"", legacy, encryption.encrypt("due")]
+
+        assert encryption.decrypt_many(ciphertexts) == ["uno", "", "testo storico", "due"]
+
+    def test_tampered_ciphertext_raises(self, encryption):
+        """Test that authentication failures surface as ValueError."""
+        ciphertext = bytearray(encryption.encrypt("ciao"))
+        ciphertext[-1] ^= 0x01
+
+        with pytest.raises(ValueError, match="Decryption failed"):
+            encryption.decrypt(bytes(ciphertext))
+
+    def test_invalid_key_raises(self):
+        """Test that a malformed key is rejected."""
+        with pytest.raises(ValueError, match="Invalid encryption key"):
+            FieldEncryption("not-a-valid-key")
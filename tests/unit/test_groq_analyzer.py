@@ -0,0 +1,205 @@
+"""Unit tests for GroqAnalyzer HTTP handling (mocked httpx transport)."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import httpx
+import orjson
+import pytest
+
+from domain import EmotionType, SentimentType
+from infrastructure.ml import groq_analyzer
+from infrastructure.ml.groq_analyzer import GroqAnalyzer
+
+
+def completion(content: str, status_code: int = 200, headers=None) -> httpx.Response:
+    """Build a chat completion response with the given reply text."""
+    body = {"choices": [{"message": {"content": content}}]}
+    return httpx.Response(status_code, content=orjson.dumps(body), headers=headers)
+
+
+@pytest.fixture
+def sleep(mocker):
+    """Skip real backoff waits and record them."""
+    return mocker.patch.object(groq_analyzer.asyncio, "sleep", AsyncMock())
+
+
+@pytest.fixture
+def analyzer(mocker):
+    """GroqAnalyzer whose HTTP client replays the responses in `analyzer.responses`."""
+    mocker.patch.object(groq_analyzer, "_rate_limited_until", 0.0)
+    instance = GroqAnalyzer()
+    instance.responses = []
+    instance.requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        instance.requests.append(request)
+        response = instance.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    mocker.patch.object(groq_analyzer, "_get_client", return_value=client)
+    return instance
+
+
+class TestRetries:
+    """Test suite for retry/backoff handling."""
+
+    async def test_retries_429_honoring_retry_after(self, analyzer, sleep):
+        """Test that a 429 is retried after the server-requested wait."""
+        analyzer.responses = [
+            completion("", status_code=429, headers={"retry-after": "2"}),
+            completion("joy"),
+        ]
+
+        assert await analyzer._complete("prompt", "ciao") == "joy"
+        assert len(analyzer.requests) == 2
+        sleep.assert_awaited_once_with(2.0)
+
+    async def test_retry_after_beyond_cap_raises(self, analyzer, sleep):
+        """Test that a Retry-After longer than the cap fails fast."""
+        analyzer.responses = [completion("", status_code=429, headers={"retry-after": "60"})]
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await analyzer._complete("prompt", "ciao")
+        sleep.assert_not_awaited()
+
+    async def test_transport_error_retried_with_backoff(self, analyzer, sleep):
+        """Test that connection errors are retried with a capped jittered wait."""
+        analyzer.responses = [httpx.ConnectError("reset"), completion("fear")]
+
+        assert await analyzer._complete("prompt", "ciao") == "fear"
+        (wait,), _ = sleep.await_args
+        assert groq_analyzer.GROQ_BACKOFF_BASE <= wait <= groq_analyzer.GROQ_BACKOFF_CAP
+
+    async def test_gives_up_after_max_retries(self, analyzer, sleep):
+        """Test that persistent 5xx errors are raised after all retries."""
+        analyzer.responses = [
+            completion("", status_code=503) for _ in range(groq_analyzer.GROQ_MAX_RETRIES + 1)
+        ]
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await analyzer._complete("prompt", "ciao")
+        assert len(analyzer.requests) == groq_analyzer.GROQ_MAX_RETRIES + 1
+
+    async def test_client_errors_not_retried(self, analyzer, sleep):
+        """Test that non-retryable statuses are raised immediately."""
+        analyzer.responses = [completion("", status_code=400)]
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await analyzer._complete("prompt", "ciao")
+        assert len(analyzer.requests) == 1
+
+
+class TestRateLimitHeaders:
+    """Test suite for x-ratelimit-* tracking."""
+
+    def test_parse_reset(self):
+        """Test Groq reset duration parsing."""
+        assert groq_analyzer._parse_reset("7.66s") == pytest.approx(7.66)
+        assert groq_analyzer._parse_reset("2m59.56s") == pytest.approx(179.56)
+        assert groq_analyzer._parse_reset("120ms") == pytest.approx(0.12)
+        assert groq_analyzer._parse_reset("") == 0.0
+
+    async def test_exhausted_quota_delays_next_request(self, analyzer, sleep):
+        """Test that a zero remaining quota makes the next request wait for the reset."""
+        analyzer.responses = [
+            completion(
+                "joy",
+                headers={
+                    "x-ratelimit-remaining-requests": "0",
+                    "x-ratelimit-reset-requests": "1.5s",
+                },
+            ),
+            completion("sadness"),
+        ]
+
+        await analyzer._complete("prompt", "uno")
+        assert groq_analyzer._rate_limited_until > time.monotonic()
+
+        await analyzer._complete("prompt", "due")
+        (wait,), _ = sleep.await_args
+        assert 0 < wait <= 1.5
+
+
+class TestAnalysis:
+    """Test suite for combined-label parsing, caching and coalescing."""
+
+    async def test_combined_labels_parsed(self, analyzer):
+        """Test that "<emotion>, <sentiment>" replies are split and normalized."""
+        analyzer.responses = [completion("Joy, Positive.")]
+
+        (emotion, _), (sentiment, _) = await analyzer.analyze("Che bella giornata")
+
+        assert emotion is EmotionType.JOY
+        assert sentiment is SentimentType.POSITIVE
+
+    async def test_missing_sentiment_is_unknown_and_not_cached(self, analyzer):
+        """Test that UNKNOWN labels are never cached, only the recognized ones."""
+        analyzer.responses = [completion("anger"), completion("boh"), completion("boh")]
+
+        (emotion, _), (sentiment, _) = await analyzer.analyze("Basta!")
+
+        assert emotion is EmotionType.ANGER
+        assert sentiment is SentimentType.UNKNOWN
+        assert analyzer._cache.get(("emotion", "basta!")) is not None
+        assert analyzer._cache.get(("sentiment", "basta!")) is None
+
+        # Single-label queries follow the same rule
+        emotion, _ = await analyzer.analyze_emotion("Mah")
+        sentiment, _ = await analyzer.analyze_sentiment("Mah")
+
+        assert emotion is EmotionType.UNKNOWN
+        assert sentiment is SentimentType.UNKNOWN
+        assert analyzer._cache.get(("emotion", "mah")) is None
+        assert analyzer._cache.get(("sentiment", "mah")) is None
+
+    async def test_repeat_text_served_from_cache(self, analyzer):
+        """Test that normalized repeat inputs skip the API."""
+        analyzer.responses = [completion("joy positive")]
+
+        first = await analyzer.analyze("Ciao!")
+        second = await analyzer.analyze("  ciao! ")
+
+        assert first == second
+        assert len(analyzer.requests) == 1
+
+    async def test_concurrent_duplicates_coalesced(self, analyzer):
+        """Test that identical in-flight requests share one API call."""
+        analyzer.responses = [completion("love positive")]
+
+        results = await asyncio.gather(*(analyzer.analyze("Ti voglio bene") for _ in range(3)))
+
+        assert len(analyzer.requests) == 1
+        assert all(result == results[0] for result in results)
+        assert analyzer._inflight == {}
+
+    async def test_api_failure_returns_unknown(self, analyzer, sleep):
+        """Test that a failed request degrades to UNKNOWN labels."""
+        analyzer.responses = [completion("", status_code=401)]
+
+        (emotion, score), (sentiment, _) = await analyzer.analyze("ciao")
+
+        assert emotion is EmotionType.UNKNOWN
+        assert sentiment is SentimentType.UNKNOWN
+        assert score.to_float() == 0.0
+
+
+class TestSharedClient:
+    """Test suite for the module-level HTTP client."""
+
+    async def test_close_does_not_break_other_instances(self, mocker):
+        """Test that closing one analyzer leaves others with a working client."""
+        mocker.patch.object(groq_analyzer, "_client", None)
+        first, second = GroqAnalyzer(), GroqAnalyzer()
+        closed = groq_analyzer._get_client()
+
+        await first.close()
+
+        client = groq_analyzer._get_client()
+        assert closed.is_closed
+        assert client is not closed and not client.is_closed
+        await second.close()
@@ -0,0 +1,55 @@
+"""Unit tests for TTLCache."""
+
+from infrastructure.cache.memory_cache import TTLCache
+
+
+class TestTTLCache:
+    """Test suite for the in-process TTL cache."""
+
+    def test_set_and_get(self):
+        """Test storing and retrieving a value."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set(("emotion", "ciao"), "joy")
+
+        assert cache.get(("emotion", "ciao")) == "joy"
+        assert cache.get(("emotion", "missing")) is None
+
+    def test_expired_entry_is_dropped(self, mocker):
+        """Test that entries past their TTL are not returned."""
+        clock = mocker.patch("infrastructure.cache.memory_cache.time.monotonic", return_value=100.0)
+        cache = TTLCache(maxsize=10, ttl=5)
+        cache.set("key", "value")
+
+        clock.return_value = 106.0
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test LRU eviction once maxsize is exceeded."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_clear(self):
+        """Test clearing all entries."""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_stats_count_hits_and_misses(self):
+        """Test hit/miss counters."""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
@@ -0,0 +1,130 @@
+"""Unit tests for monthly partition maintenance."""
+
+from contextlib import contextmanager
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from infrastructure.database import connection
+
+
+class FakeSession:
+    """Records the SQL it is given and answers queries from a shared script."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def _record(self, statement):
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        self.db.log.append(" ".join(sql.split()))
+
+    def scalar(self, statement, params=None):
+        self._record(statement)
+        return self.db.scalar_results.pop(0)
+
+    def scalars(self, statement):
+        self._record(statement)
+        return Mock(all=Mock(return_value=self.db.stranded_months))
+
+    def execute(self, statement, params=None):
+        self._record(statement)
+        return Mock()
+
+
+@pytest.fixture
+def db(mocker):
+    """Patch get_db_session with fake sessions sharing one SQL log."""
+    state = SimpleNamespace(log=[], scalar_results=[], stranded_months=[], transactions=0)
+
+    @contextmanager
+    def fake_db_session():
+        state.transactions += 1
+        yield FakeSession(state)
+
+    mocker.patch.object(connection, "get_db_session", fake_db_session)
+    return state
+
+
+class TestCreateMonthlyPartition:
+    """Test suite for _create_monthly_partition."""
+
+    def test_skips_existing_partition(self, db):
+        """Test that an existing partition is left alone."""
+        db.scalar_results = ["emotions_2026_11"]
+
+        assert connection._create_monthly_partition("emotions", date(2026, 11, 1)) is False
+        assert len(db.log) == 1
+
+    def test_creates_partition_when_default_is_empty(self, db):
+        """Test the plain CREATE when no rows of the month are in the default partition."""
+        db.scalar_results = [None, 0]
+
+        assert connection._create_monthly_partition("emotions", date(2026, 11, 1)) is True
+        assert db.log[-1] == (
+            "CREATE TABLE emotions_2026_11 PARTITION OF emotions FOR VALUES "
+            "FROM ('2026-11-01T00:00:00+00:00') TO ('2026-12-01T00:00:00+00:00')"
+        )
+        assert not any("DETACH" in sql for sql in db.log)
+
+    def test_moves_rows_out_of_default_partition(self, db):
+        """Test that rows of the month already in the default partition are moved."""
+        db.scalar_results = [None, 7]
+
+        assert connection._create_monthly_partition("audit_log", date(2026, 11, 1)) is True
+
+        assert db.log[1] == "LOCK TABLE audit_log IN SHARE ROW EXCLUSIVE MODE"
+        detach, create, move, attach = db.log[-4:]
+        assert detach == "ALTER TABLE audit_log DETACH PARTITION audit_log_default"
+        assert create.startswith("CREATE TABLE audit_log_2026_11 PARTITION OF audit_log ")
+        assert move.startswith("WITH moved AS (DELETE FROM audit_log_default WHERE")
+        assert "INSERT INTO audit_log_2026_11 (id, user_id, action" in move
+        assert attach == "ALTER TABLE audit_log ATTACH PARTITION audit_log_default DEFAULT"
+        assert db.transactions == 1
+
+
+class TestEnsureMonthlyPartitions:
+    """Test suite for ensure_monthly_partitions."""
+
+    @pytest.fixture(autouse=True)
+    def frozen_now(self, mocker):
+        """Pin the current month to October 2026."""
+        now = Mock(return_value=datetime(2026, 10, 16, tzinfo=UTC))
+        mocker.patch.object(connection, "datetime", Mock(wraps=datetime, now=now))
+
+    def test_failure_does_not_stop_other_partitions(self, db, mocker):
+        """Test that one failing partition does not prevent the others."""
+
+        def create(table, month):
+            if month == date(2026, 11, 1):
+                raise RuntimeError("partition would overlap")
+            return True
+
+        create_partition = mocker.patch.object(
+            connection, "_create_monthly_partition", side_effect=create
+        )
+
+        connection.ensure_monthly_partitions(months_ahead=2)
+
+        months = [date(2026, 10, 1), date(2026, 11, 1), date(2026, 12, 1)]
+        assert create_partition.call_args_list == [
+            mocker.call(table, month) for table in ("emotions", "audit_log") for month in months
+        ]
+
+    def test_stranded_months_get_a_partition(self, db, mocker):
+        """Test that past months found in the default partition are covered too."""
+        db.stranded_months = [date(2025, 1, 1)]
+        create_partition = mocker.patch.object(
+            connection, "_create_monthly_partition", return_value=True
+        )
+
+        connection.ensure_monthly_partitions(months_ahead=0)
+
+        assert create_partition.call_args_list == [
+            mocker.call("emotions", date(2025, 1, 1)),
+            mocker.call("emotions", date(2026, 10, 1)),
+            mocker.call("audit_log", date(2025, 1, 1)),
+            mocker.call("audit_log", date(2026, 10, 1)),
+        ]
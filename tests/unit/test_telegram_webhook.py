@@ -0,0 +1,15 @@
+"""Unit tests for the Telegram webhook's shared Bot."""
+
+from presentation.api.routes import telegram_webhook
+
+
+async def test_close_bot_closes_http_clients():
+    """Test that shutdown closes the Bot's HTTP clients even though it was never initialized."""
+    telegram_webhook._get_bot()
+    clients = [request._client for request in telegram_webhook._bot_requests]
+    assert not any(client.is_closed for client in clients)
+
+    await telegram_webhook.close_bot()
+
+    assert all(client.is_closed for client in clients)
+    assert telegram_webhook._bot is None
@@ -0,0 +1,93 @@
+"""Unit tests for UserRepository."""
+
+from datetime import UTC, datetime
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from domain import User, UserId
+from infrastructure.database.models import UserModel
+from infrastructure.repositories import user_repository
+from infrastructure.repositories.user_repository import UserRepository
+
+
+def compiled(statement) -> str:
+    """Render a statement as PostgreSQL SQL on one line."""
+    return " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+
+
+@pytest.fixture
+def session():
+    """Mock SQLAlchemy session."""
+    return Mock()
+
+
+@pytest.fixture
+def enqueue_last_seen(mocker):
+    """Capture write-behind last_seen_at updates."""
+    return mocker.patch.object(user_repository, "enqueue_last_seen")
+
+
+def db_user(telegram_id: str) -> UserModel:
+    """Build a persisted-looking UserModel."""
+    now = datetime.now(UTC)
+    return UserModel(
+        id=uuid4(),
+        telegram_id_hash=UserId.from_telegram(telegram_id).hashed_id,
+        created_at=now,
+        last_seen_at=now,
+        is_active=True,
+    )
+
+
+class TestFindOrCreate:
+    """Test suite for find_or_create_by_telegram_id."""
+
+    def test_existing_user_enqueues_last_seen(self, session, enqueue_last_seen):
+        """Test that a known user is returned and last_seen_at is written behind."""
+        existing = db_user("12345")
+        session.scalars.return_value.first.return_value = existing
+
+        user = UserRepository(session).find_or_create_by_telegram_id("12345")
+
+        assert user.id == existing.id
+        assert session.scalars.call_count == 1  # Only the SELECT, no upsert
+        enqueue_last_seen.assert_called_once()
+        user_id, seen_at = enqueue_last_seen.call_args.args
+        assert user_id == existing.id
+        assert seen_at is not None
+        assert seen_at == user.last_seen_at
+
+    def test_new_user_created_with_upsert(self, session, enqueue_last_seen):
+        """Test that an unknown user is inserted with ON CONFLICT on the telegram hash."""
+        created = db_user("67890")
+        session.scalars.return_value.first.return_value = None
+        session.scalars.return_value.one.return_value = created
+
+        user = UserRepository(session).find_or_create_by_telegram_id("67890")
+
+        assert user.id == created.id
+        assert user.user_id.hashed_id == UserId.from_telegram("67890").hashed_id
+        upsert = compiled(session.scalars.call_args_list[-1].args[0])
+        assert upsert.startswith("INSERT INTO users")
+        assert "ON CONFLICT (telegram_id_hash) DO UPDATE SET last_seen_at = now()" in upsert
+        assert "RETURNING users.id" in upsert
+        enqueue_last_seen.assert_not_called()
+
+
+class TestSave:
+    """Test suite for save."""
+
+    def test_save_is_single_upsert_on_id(self, session):
+        """Test that save issues one INSERT ... ON CONFLICT (id) DO UPDATE."""
+        user = User.create("12345")
+
+        assert UserRepository(session).save(user) is user
+
+        session.execute.assert_called_once()
+        upsert = compiled(session.execute.call_args.args[0])
+        assert "ON CONFLICT (id) DO UPDATE SET" in upsert
+        assert "last_seen_at = excluded.last_seen_at" in upsert
+        assert "is_active = excluded.is_active" in upsert
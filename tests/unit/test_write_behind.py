@@ -0,0 +1,112 @@
+"""Unit tests for the write-behind flusher's batch writes."""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from infrastructure.database import connection
+
+
+class FakeCopy:
+    """Records the COPY statements and rows written through psycopg's copy()."""
+
+    def __init__(self):
+        self.copies: list[tuple[str, list[list]]] = []
+
+    @asynccontextmanager
+    async def copy(self, statement):
+        rows: list[list] = []
+        self.copies.append((statement.as_string(None), rows))
+
+        async def write_row(row):
+            rows.append(row)
+
+        yield MagicMock(write_row=write_row)
+
+
+@pytest.fixture
+def session(mocker):
+    """Async session whose raw driver connection records COPY traffic."""
+    recorder = FakeCopy()
+
+    @asynccontextmanager
+    async def cursor():
+        yield recorder
+
+    raw_connection = MagicMock()
+    raw_connection.driver_connection.cursor = cursor
+    sa_connection = MagicMock(get_raw_connection=AsyncMock(return_value=raw_connection))
+    fake_session = MagicMock(
+        execute=AsyncMock(), connection=AsyncMock(return_value=sa_connection), copies=recorder
+    )
+
+    @asynccontextmanager
+    async def fake_async_db_session():
+        yield fake_session
+
+    mocker.patch.object(connection, "get_async_db_session", fake_async_db_session)
+    return fake_session
+
+
+def audit_row(**extra):
+    """One queued audit row."""
+    return (
+        "audit",
+        {
+            "user_id": None,
+            "action": "POST /emotion",
+            "endpoint": "/emotion",
+            "ip_address": "10.0.0.1",
+            "user_agent": "pytest",
+            "created_at": datetime.now(UTC),
+            **extra,
+        },
+    )
+
+
+class TestFlushWrites:
+    """Test suite for _flush_writes."""
+
+    async def test_small_batch_uses_executemany(self, session):
+        """Test that batches below the COPY threshold go through INSERT."""
+        await connection._flush_writes([audit_row() for _ in range(3)])
+
+        assert session.copies.copies == []
+        stmt, rows = session.execute.await_args_list[-1].args
+        assert stmt.is_insert
+        assert len(rows) == 3
+
+    async def test_large_batch_uses_copy(self, session):
+        """Test that at least _WRITE_COPY_THRESHOLD audit rows are streamed with COPY."""
+        batch = [audit_row() for _ in range(connection._WRITE_COPY_THRESHOLD)]
+        batch.append(("last_seen", {"id": uuid4(), "last_seen_at": datetime.now(UTC)}))
+
+        await connection._flush_writes(batch)
+
+        [(statement, rows)] = session.copies.copies
+        assert statement == (
+            'COPY "audit_log" ("user_id", "action", "endpoint", "ip_address", '
+            '"user_agent", "created_at") FROM STDIN'
+        )
+        assert len(rows) == connection._WRITE_COPY_THRESHOLD
+        assert rows[0][:3] == [None, "POST /emotion", "/emotion"]
+        # The last-seen update still goes through a regular executemany UPDATE
+        stmt, _ = session.execute.await_args_list[-1].args
+        assert stmt.is_update
+
+    async def test_copy_groups_rows_by_columns(self, session):
+        """Test that rows with different key sets are copied with their own columns."""
+        user_id = uuid4()
+        batch = [audit_row() for _ in range(connection._WRITE_COPY_THRESHOLD)]
+        batch.append(audit_row(user_id=user_id, id=uuid4()))
+
+        await connection._flush_writes(batch)
+
+        (first, first_rows), (second, second_rows) = session.copies.copies
+        assert '"id"' not in first
+        assert len(first_rows) == connection._WRITE_COPY_THRESHOLD
+        assert second.endswith('"created_at", "id") FROM STDIN')
+        assert second_rows[0][0] == user_id